@@ -1,12 +1,15 @@
+import contextlib
+import itertools
 import json
 import os
 import sys
 import csv
 import typing
 import pathlib
-from functools import partial
+from collections import defaultdict
+from functools import lru_cache
 import sanity_checks
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -25,13 +28,196 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QFrame,
     QDialog,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSignalBlocker, QTimer
 from PyQt6.QtGui import QFont, QCloseEvent
 from PyQt6.QtGui import QWheelEvent
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to the stdlib
+    orjson = None
+
+
+def _load_json_file(path: str) -> typing.Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        typing.Any: The decoded JSON document.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json_file(path: str, data: typing.Any) -> None:
+    """Write data as JSON indented by two spaces, using orjson when it is installed.
+
+    The document is serialized in memory and written to a temporary file in one
+    go, flushed to disk and then moved over the target, so a crash mid-write never
+    leaves a truncated file behind.
+
+    Args:
+        path (str): Path to the JSON file.
+        data (typing.Any): The JSON-serializable document.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False, italic: bool = False) -> QFont:
+    """Return a shared font with the given size and style.
+
+    Fonts are created on first use, after the QApplication exists, and reused
+    for every later widget. Callers must not modify the returned font.
+
+    Args:
+        point_size (int): The font size in points.
+        bold (bool): Whether the font is bold.
+        italic (bool): Whether the font is italic.
+
+    Returns:
+        QFont: The shared font.
+    """
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+# Prefixes used in export.json to attach free text to the "Other" and "Discussion needed" options
+_OTHER_PREFIX = "Other: "
+_DISCUSSION_PREFIX = "Discussion needed: "
+
+_QSS_PAPER_INFO = "background-color: #2c3e50; color: #ecf0f1; padding: 10px; border-radius: 5px; border: 1px solid #1a252f;"
+_QSS_EXCLUDE_CHECKBOX = "QCheckBox { color: #d9534f; padding: 5px; }"
+_QSS_EXCLUDE_REASON_LABEL = "color: #666666; padding: 5px 0px 2px 20px;"
+_QSS_EXCLUDE_REASON_ACTIVE = "QLineEdit { background-color: white; color: #333333; border: 1px solid #d9534f; border-radius: 3px; padding: 5px; margin-left: 20px; }"
+_QSS_EXCLUDE_REASON_INACTIVE = "QLineEdit { background-color: #f9f9f9; color: #999999; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; margin-left: 20px; }"
+
+# Stylesheets of the question tab scroll area and of line edits enabled at runtime
+_QSS_WHITE_SCROLL_AREA = "QScrollArea { background-color: white; }"
+_QSS_LINE_EDIT_ENABLED = "QLineEdit { background-color: white; border: 1px solid #4CAF50; border-radius: 3px; padding: 5px; color: #333333; }"
+_QSS_LINE_EDIT_DISABLED = "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
+
+# Stylesheets of the "Discussion needed" field and of its text input while it is
+# active and inactive
+_QSS_DISCUSSION_FRAME = "QFrame { background-color: #e8e8e8; border: 2px solid #999999; border-radius: 5px; padding: 10px; }"
+_QSS_DISCUSSION_LABEL = "color: #555555;"
+_QSS_DISCUSSION_ACTIVE = "QLineEdit { background-color: white; border: 1px solid #ff9800; border-radius: 3px; padding: 5px; font-size: 10pt; color: #333333; }"
+_QSS_DISCUSSION_INACTIVE = "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; font-size: 10pt; color: #999999; }"
+
+# Stylesheets of the list of values of a multiple-selection widget and of its rows
+_QSS_SELECTED_VALUES = "QWidget { background-color: #f9f9f9; border: 1px solid #e0e0e0; border-radius: 3px; padding: 8px; }"
+_QSS_NO_VALUES_LABEL = "color: #999999; font-style: italic;"
+_QSS_VALUE_LABEL = "color: #1a1a1a; font-weight: 500;"
+_QSS_DELETE_BUTTON = (
+    "QPushButton { background-color: #f44336; color: white; font-weight: bold; border: none; border-radius: 3px; padding: 3px; font-size: 11pt; }"
+    "QPushButton:hover { background-color: #da190b; }"
+    "QPushButton:pressed { background-color: #ba0000; }"
+)
+
+# Shared stylesheet of a question tab's container. Widgets with a static look pick
+# their rule via the "qssClass" property, so Qt parses the sheet once per tab instead
+# of once per widget; widgets whose look changes at runtime keep their own sheet.
+_QSS_QUESTION_TAB = """
+QWidget { background-color: white; }
+QLabel[qssClass="attribute"] { color: #1a1a1a; padding: 5px 0px; }
+QLabel[qssClass="field"] { color: #555555; font-weight: bold; padding: 5px 0px; }
+QCheckBox[qssClass="option"] { color: #333333; font-size: 10pt; }
+QRadioButton[qssClass="option"] { color: #333333; font-size: 10pt; }
+QCheckBox[qssClass="toggle"] { color: #1976d2; font-weight: bold; padding: 5px 0px; }
+QLineEdit[qssClass="mandatory"] { background-color: white; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #333333; }
+QComboBox[qssClass="options"] { background-color: white; color: #333333; border: 1px solid #cccccc; border-radius: 3px; padding: 5px; min-height: 25px; font-size: 10pt; }
+QComboBox[qssClass="options"]::drop-down { border: none; }
+QPushButton[qssClass="add"] { background-color: #4CAF50; color: white; font-weight: bold; border: none; border-radius: 3px; padding: 5px; font-size: 12pt; }
+QPushButton[qssClass="add"]:hover { background-color: #45a049; }
+QPushButton[qssClass="add"]:pressed { background-color: #3d8b40; }
+QFrame[qssClass="separator"] { border: 1px solid #e0e0e0; }
+"""
+
+
+# Entries of an options list that select the widget type instead of being options
+_OPTION_MARKERS = frozenset(("single-choice", "Multiple"))
+
+
+class AttributeSpec(NamedTuple):
+    """Parsed configuration of a single attribute (category) of a research question."""
+
+    attribute: str
+    display_options: List[str]  # Options shown to the user, markers removed
+    is_single_choice: bool
+    is_multiple: bool
+    has_other: bool
+    toggle_config: Optional[dict]  # Only set if the toggle option is enabled
+    mandatory_text_config: Optional[dict]  # Only set if the text field is enabled
+
+
+def _parse_attribute_spec(attribute: str, options: typing.Any) -> AttributeSpec:
+    """Parse the options of an attribute from data-items.json.
+
+    Handles both the old list format and the new dict format with "options" and
+    optionally "toggle_option" or "mandatory_text_field".
+
+    Args:
+        attribute (str): The attribute (category) name.
+        options (typing.Any): The attribute's options as stored in data-items.json.
+
+    Returns:
+        AttributeSpec: The parsed attribute configuration.
+    """
+    toggle_config = None
+    mandatory_text_config = None
+    if isinstance(options, dict):
+        display_options_base = options.get("options", [])
+        toggle_config = options.get("toggle_option", None)
+        # Check if toggle_option is enabled
+        if toggle_config and not toggle_config.get("enabled", False):
+            toggle_config = None
+        mandatory_text_config = options.get("mandatory_text_field", None)
+        # Check if mandatory_text_field is enabled
+        if mandatory_text_config and not mandatory_text_config.get("enabled", False):
+            mandatory_text_config = None
+    else:
+        # Old list format
+        display_options_base = options if isinstance(options, list) else []
+
+    # Remove the markers from the options list for display, add "Underspecified" and
+    # "Discussion needed" to all attributes, and drop duplicates while keeping the order
+    display_options = list(
+        dict.fromkeys(
+            [opt for opt in display_options_base if opt not in _OPTION_MARKERS]
+            + ["Underspecified", "Discussion needed"]
+        )
+    )
+
+    return AttributeSpec(
+        attribute=attribute,
+        display_options=display_options,
+        is_single_choice="single-choice" in display_options_base,
+        is_multiple="Multiple" in display_options_base,
+        has_other="Other" in display_options_base,
+        toggle_config=toggle_config,
+        mandatory_text_config=mandatory_text_config,
+    )
+
 
 class NoScrollComboBox(QComboBox):
     """Custom QComboBox that ignores wheel events to prevent scrolling from changing selection."""
@@ -42,6 +228,62 @@ class NoScrollComboBox(QComboBox):
             e.ignore()
 
 
+class FinishedPapersModel(QAbstractListModel):
+    """List model for finished papers shown in the paper selection dialog.
+
+    Stores the paper fields in parallel lists and formats the display text
+    only when the view asks for a row.
+    """
+
+    def __init__(self, finished_papers: List[tuple], parent=None) -> None:
+        """Initialize the Finished Papers Model.
+
+        Args:
+            finished_papers (List[tuple]): List of tuples (paper_key, title, authors, year, has_open_discussion).
+            parent: The parent object.
+        """
+        super().__init__(parent)
+        self.keys: List[str] = [paper[0] for paper in finished_papers]
+        self.titles: List[str] = [paper[1] for paper in finished_papers]
+        self.authors: List[str] = [paper[2] for paper in finished_papers]
+        self.years: List[str] = [paper[3] for paper in finished_papers]
+        self.open_discussions: List[bool] = [paper[4] for paper in finished_papers]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of finished papers."""
+        if parent.isValid():
+            return 0
+        return len(self.keys)
+
+    def data(
+        self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> typing.Any:
+        """Return the data for a row.
+
+        Args:
+            index (QModelIndex): The row to read.
+            role (int): The requested item data role.
+
+        Returns:
+            typing.Any: Display text, paper key (UserRole), text color for papers
+            with open discussions (ForegroundRole), or None.
+        """
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (
+                f"{self.titles[row]}\n  Authors: {self.authors[row]}\n"
+                f"  Year: {self.years[row]}\n  Key: {self.keys[row]}"
+            )
+        if role == Qt.ItemDataRole.UserRole:
+            return self.keys[row]
+        if role == Qt.ItemDataRole.ForegroundRole and self.open_discussions[row]:
+            return Qt.GlobalColor.red
+        return None
+
+
 class PaperSelectionDialog(QDialog):
     """Dialog for selecting previously finished papers to edit.
 
@@ -53,7 +295,7 @@ class PaperSelectionDialog(QDialog):
         """Initialize the Paper Selection Dialog.
 
         Args:
-            finished_papers (List[tuple]): List of tuples (paper_key, title, authors, year) for completed papers.
+            finished_papers (List[tuple]): List of tuples (paper_key, title, authors, year, has_open_discussion) for completed papers.
             parent: The parent widget.
         """
         super().__init__(parent)
@@ -69,33 +311,18 @@ class PaperSelectionDialog(QDialog):
         layout = QVBoxLayout()
 
         title_label = QLabel("Select a paper to review or update:")
-        title_font = QFont()
-        title_font.setPointSize(11)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_font(11, bold=True))
         layout.addWidget(title_label)
 
-        # Create list widget for finished papers
-        self.paper_list = QListWidget()
-        self.paper_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-
-        for (
-            paper_key,
-            title,
-            authors,
-            year,
-            has_open_discussion,
-        ) in self.finished_papers:
-            item_text = (
-                f"{title}\n  Authors: {authors}\n  Year: {year}\n  Key: {paper_key}"
-            )
-            item = QListWidgetItem(item_text)
-            if has_open_discussion:
-                item.setForeground(Qt.GlobalColor.red)
-            item.setData(
-                Qt.ItemDataRole.UserRole, paper_key
-            )  # Store paper_key for retrieval
-            self.paper_list.addItem(item)
+        # Create list view for finished papers; rows are formatted on demand by the model
+        self.paper_model = FinishedPapersModel(self.finished_papers, self)
+        self.paper_list = QListView()
+        self.paper_list.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.paper_list.setUniformItemSizes(True)
+        # Lay out rows in batches so the dialog stays responsive for long lists
+        self.paper_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.paper_list.setBatchSize(50)
+        self.paper_list.setModel(self.paper_model)
 
         layout.addWidget(self.paper_list)
 
@@ -116,14 +343,16 @@ class PaperSelectionDialog(QDialog):
 
     def on_select(self) -> None:
         """Handle selection button click."""
-        current_item = self.paper_list.currentItem()
-        if current_item is None:
+        current_index = self.paper_list.currentIndex()
+        if not current_index.isValid():
             QMessageBox.warning(
                 self, "No Selection", "Please select a paper from the list."
             )
             return
 
-        self.selected_paper_key = current_item.data(Qt.ItemDataRole.UserRole)
+        self.selected_paper_key = self.paper_model.data(
+            current_index, Qt.ItemDataRole.UserRole
+        )
         self.accept()
 
     def get_selected_paper_key(self) -> Optional[str]:
@@ -161,13 +390,22 @@ class DataExtractionGUI(QMainWindow):
         super().__init__()
         self.json_file = json_file
         self.csv_file = csv_file
-        self.user = user
+        self.user = sys.intern(user)
         self.data: Dict[str, Dict[str, List[str]]] = {}
+        self._question_schema: Dict[str, List[AttributeSpec]] = (
+            {}
+        )  # Parsed self.data: question_key -> attribute specs
+        self._combo_index: Dict[tuple, Dict[str, int]] = (
+            {}
+        )  # (question_key, attribute) -> option -> index in its dropdown
         self.papers: Dict[str, Dict[str, str]] = {}
         self.paper_keys: List[str] = []  # Ordered list of paper keys
+        self._paper_index_by_key: Dict[str, int] = {}  # paper_key -> index
         self.current_paper_index: int = 0  # Index of current paper being worked on
         self.selected_values: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
-        self.selected_Other_text: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self.selected_Other_text: Dict[str, Dict[str, Dict[str, str]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
         self.checkboxes: Dict[str, QCheckBox] = {}
         self.text_inputs: Dict[str, QLineEdit] = {}
         self.radio_buttons: Dict[str, QRadioButton] = {}
@@ -182,17 +420,29 @@ class DataExtractionGUI(QMainWindow):
         self.toggle_line_edits: Dict[str, QLineEdit] = (
             {}
         )  # Line edits for toggle-associated text
-        self.toggle_states: Dict[str, Dict[str, Dict[str, bool]]] = (
-            {}
+        self.toggle_states: Dict[str, Dict[str, Dict[str, bool]]] = defaultdict(
+            lambda: defaultdict(dict)
         )  # Track toggle states: entry_key -> question_key -> attribute -> bool
-        self.toggle_texts: Dict[str, Dict[str, Dict[str, str]]] = (
-            {}
+        self.toggle_texts: Dict[str, Dict[str, Dict[str, str]]] = defaultdict(
+            lambda: defaultdict(dict)
         )  # Track toggle text: entry_key -> question_key -> attribute -> str
         self.mandatory_text_inputs: Dict[str, QLineEdit] = (
             {}
         )  # Line edits for mandatory text fields
-        self.mandatory_texts: Dict[str, Dict[str, Dict[str, str]]] = (
+        self._built_question_tabs: set = (
+            set()
+        )  # Question keys whose tab contents exist for the current paper
+        self._selected_values_layouts: Dict[tuple, QVBoxLayout] = (
             {}
+        )  # Multiple-selection value lists: (entry_key, question_key, attribute) -> layout
+        self._selected_value_rows: Dict[tuple, Dict[str, QHBoxLayout]] = (
+            {}
+        )  # Rows of those lists: (entry_key, question_key, attribute) -> value -> row
+        self._discussion_state: Dict[str, bool] = (
+            {}
+        )  # Discussion fields last shown (True) or hidden and cleared (False)
+        self.mandatory_texts: Dict[str, Dict[str, Dict[str, str]]] = defaultdict(
+            lambda: defaultdict(dict)
         )  # Track mandatory text: entry_key -> question_key -> attribute -> str
         self.question_tabs: Optional[QTabWidget] = (
             None  # Reference to nested question tabs
@@ -209,6 +459,19 @@ class DataExtractionGUI(QMainWindow):
         self.exclude_reason_input: Optional[QLineEdit] = (
             None  # Reference to the exclusion reason text field
         )
+        self._export_cache: Optional[dict] = (
+            None  # Parsed export.json, reused until the file changes on disk
+        )
+        self._export_mtime: int = -1  # st_mtime_ns of the cached export.json
+        self._export_dirty: set = set()  # Papers edited since the last export
+        self._last_excluded_style: Optional[bool] = (
+            None  # Exclusion state the reason field is currently styled for
+        )
+
+        # Sanity check rules are read once and reused for every finished paper
+        self._sanity_rules: List[sanity_checks.CompiledRule] = sanity_checks.load_rules(
+            str(pathlib.Path("sanity_checks.json"))
+        )
 
         # Load data and initialize UI
         if self.load_json_data() and self.load_csv_data():
@@ -223,8 +486,23 @@ class DataExtractionGUI(QMainWindow):
             bool: True if loaded successfully, False Otherwise.
         """
         try:
-            with open(self.json_file, "r") as f:
-                self.data = json.load(f)
+            self.data = _load_json_file(self.json_file)
+            self._question_schema = {
+                question_key: [
+                    _parse_attribute_spec(attribute, options)
+                    for attribute, options in options_dict.items()
+                ]
+                for question_key, options_dict in self.data.items()
+            }
+            # Dropdowns list a placeholder item first, followed by the display options
+            self._combo_index = {
+                (question_key, spec.attribute): {
+                    option: index
+                    for index, option in enumerate(spec.display_options, start=1)
+                }
+                for question_key, attribute_specs in self._question_schema.items()
+                for spec in attribute_specs
+            }
             return True
         except FileNotFoundError:
             print(f"Error: {self.json_file} not found", file=sys.stderr)
@@ -245,33 +523,55 @@ class DataExtractionGUI(QMainWindow):
         try:
             with open(self.csv_file, "r", encoding="utf-8") as f:
                 # The CSV uses semicolon as delimiter
-                reader = csv.DictReader(f, delimiter=";")
+                reader = csv.reader(f, delimiter=";")
+                header = next(reader, [])
 
-                for row in reader:
-                    # The header has 'assignee,,,', so we need to find the correct key
-                    assignee_value = None
-                    for key in row.keys():
-                        if "assignee" in key.lower():
-                            assignee_value = row[key]
-                            break
+                # Resolve the column positions once from the header
+                columns = {name.strip().lower(): idx for idx, name in enumerate(header)}
+                # The header has 'assignee,,,', so we need to find the correct column
+                assignee_idx = next(
+                    (
+                        idx
+                        for idx, name in enumerate(header)
+                        if "assignee" in name.lower()
+                    ),
+                    None,
+                )
+                if assignee_idx is None:
+                    print(
+                        f"Error: No assignee column found in {self.csv_file}",
+                        file=sys.stderr,
+                    )
+                    return False
+                itemkey_idx = columns.get("itemkey")
+                title_idx = columns.get("title")
+                author_idx = columns.get("author")
+                year_idx = columns.get("year")
 
+                for row in reader:
+                    assignee_value = self._csv_field(row, assignee_idx, "")
                     if not assignee_value:
                         continue
 
-                    # Extract the assignee name (remove trailing commas from the value)
-                    assignee = assignee_value.strip().rstrip(",").strip()
+                    # Extract the assignee name (remove trailing commas from the value).
+                    # Names repeat across rows, so interning makes the user comparison an identity check.
+                    assignee = sys.intern(assignee_value.rstrip(",").strip())
                     if assignee != self.user:
                         continue
 
-                    itemkey = row.get("itemkey", "").strip()
+                    itemkey = self._csv_field(row, itemkey_idx, "")
                     if not itemkey:
                         continue
 
                     self.papers[itemkey] = {
                         "itemkey": itemkey,
-                        "title": row.get("title", "Unknown Title").strip(),
-                        "authors": row.get("author", "Unknown Authors").strip(),
-                        "year": row.get("year", "Unknown Year").strip(),
+                        "title": self._csv_field(row, title_idx, "Unknown Title"),
+                        "authors": sys.intern(
+                            self._csv_field(row, author_idx, "Unknown Authors")
+                        ),
+                        "year": sys.intern(
+                            self._csv_field(row, year_idx, "Unknown Year")
+                        ),
                     }
                     self.paper_keys.append(itemkey)
 
@@ -282,6 +582,9 @@ class DataExtractionGUI(QMainWindow):
                 )
                 return False
 
+            self._paper_index_by_key = {
+                paper_key: index for index, paper_key in enumerate(self.paper_keys)
+            }
             return True
         except FileNotFoundError:
             print(f"Error: {self.csv_file} not found", file=sys.stderr)
@@ -290,6 +593,68 @@ class DataExtractionGUI(QMainWindow):
             print(f"Error reading {self.csv_file}: {str(e)}", file=sys.stderr)
             return False
 
+    @staticmethod
+    def _csv_field(row: List[str], index: Optional[int], default: str) -> str:
+        """Return the stripped value of a CSV column, or a default if it is absent.
+
+        Args:
+            row (List[str]): The parsed CSV row.
+            index (Optional[int]): Column index resolved from the header, or None if missing.
+            default (str): Value to use when the column or field does not exist.
+
+        Returns:
+            str: The stripped field value or the default.
+        """
+        if index is None or index >= len(row):
+            return default
+        return row[index].strip()
+
+    @staticmethod
+    def _has_any_response(responses: Dict[str, Dict[str, List[str]]]) -> bool:
+        """Check whether any attribute in the exported responses has a selection.
+
+        Args:
+            responses (Dict[str, Dict[str, List[str]]]): Exported responses (question_key -> attribute -> selections).
+
+        Returns:
+            bool: True if at least one attribute has a selection, False Otherwise.
+        """
+        return any(
+            selections
+            for attributes in responses.values()
+            for selections in attributes.values()
+        )
+
+    def _get_exported_data(self) -> dict:
+        """Return the parsed contents of export.json.
+
+        The parsed dict is cached and only re-read when the file's modification
+        time changes, so repeated scans during startup and paper loads cost a
+        single decode. Callers must treat the returned dict as read-only.
+
+        Returns:
+            dict: The exported data, or an empty dict if the file is missing or unreadable.
+        """
+        export_file = "export.json"
+        try:
+            mtime = os.stat(export_file).st_mtime_ns
+        except OSError:
+            self._export_cache = None
+            self._export_mtime = -1
+            return {}
+
+        if self._export_cache is not None and mtime == self._export_mtime:
+            return self._export_cache
+
+        try:
+            exported_data = _load_json_file(export_file)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        self._export_cache = exported_data
+        self._export_mtime = mtime
+        return exported_data
+
     def find_first_unprocessed_paper(self) -> int:
         """Find the index of the first paper without exported data.
 
@@ -302,62 +667,48 @@ class DataExtractionGUI(QMainWindow):
             int: Index of the first unprocessed paper, or 0 if no export file exists.
         """
         session_file = ".session.json"
-        export_file = "export.json"
 
         # Check if there's a session file with incomplete work
-        if os.path.exists(session_file):
-            try:
-                with open(session_file, "r") as f:
-                    session_data = json.load(f)
-                    # Only resume if the session is for the current user
-                    if (
-                        session_data.get("user") == self.user
-                        and "current_paper_index" in session_data
-                    ):
-                        resume_index = session_data["current_paper_index"]
-                        # Verify the paper index is valid
-                        if 0 <= resume_index < len(self.paper_keys):
-                            return resume_index
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        # If export file doesn't exist, start from the beginning
-        if not os.path.exists(export_file):
-            return 0
-
         try:
-            with open(export_file, "r") as f:
-                exported_data = json.load(f)
+            session_data = _load_json_file(session_file)
         except (json.JSONDecodeError, IOError):
-            # If file is corrupted or unreadable, start from the beginning
-            return 0
+            # A missing or unreadable session file means there is nothing to resume
+            session_data = {}
 
-        # Check each paper in order
-        for index, paper_key in enumerate(self.paper_keys):
-            # If paper is not in export file or has empty responses, it's unprocessed
-            if paper_key not in exported_data:
-                return index
+        # Only resume if the session is for the current user
+        if (
+            session_data.get("user") == self.user
+            and "current_paper_index" in session_data
+        ):
+            resume_index = session_data["current_paper_index"]
+            # Verify the paper index is valid
+            if 0 <= resume_index < len(self.paper_keys):
+                return resume_index
+
+        # A missing or unreadable export file yields no data, so we start from the beginning
+        exported_data = self._get_exported_data()
+
+        # Classify the exported papers in a single pass over the export data
+        processed_keys = set()
+        excluded_keys = set()
+        for paper_key, paper_data in exported_data.items():
+            # Excluded papers count as processed regardless of their responses
+            if paper_data.get("excluded_from_full_text_review", False):
+                excluded_keys.add(paper_key)
+                continue
 
-            paper_data = exported_data[paper_key]
+            # Papers with empty responses have no data yet
+            if self._has_any_response(paper_data.get("responses", {})):
+                processed_keys.add(paper_key)
 
-            # Check if paper is excluded - if so, it's already processed
-            if paper_data.get("excluded_from_full_text_review", False):
+        # Check each paper in order
+        for index, paper_key in enumerate(self.paper_keys):
+            if paper_key in excluded_keys:
                 self.excluded_papers[paper_key] = True
                 continue
 
-            responses = paper_data.get("responses", {})
-
-            # Check if responses are empty (paper has no data)
-            is_empty = True
-            for question_key in responses:
-                for attribute_list in responses[question_key].values():
-                    if attribute_list:  # If any attribute has selections
-                        is_empty = False
-                        break
-                if not is_empty:
-                    break
-
-            if is_empty:
+            # If paper is not in export file or has empty responses, it's unprocessed
+            if paper_key not in processed_keys:
                 return index
 
         # All papers have been processed, return last index to trigger completion
@@ -371,61 +722,41 @@ class DataExtractionGUI(QMainWindow):
             for finished papers.
         """
         finished = []
-        export_file = "export.json"
-
-        if not os.path.exists(export_file):
-            return finished
+        exported_data = self._get_exported_data()
 
-        try:
-            with open(export_file, "r") as f:
-                exported_data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return finished
-
-        # Iterate through papers to find those with responses
+        # Iterate through papers in CSV order; membership in the export is a dict lookup
         for paper_key in self.paper_keys:
-            if paper_key not in exported_data:
+            paper_data = exported_data.get(paper_key)
+            if paper_data is None:
                 continue
 
-            paper_data = exported_data[paper_key]
             responses = paper_data.get("responses", {})
 
-            # Check if paper has any responses (not empty)
-            has_responses = False
-            for question_key in responses:
-                for attribute_list in responses[question_key].values():
-                    if attribute_list:
-                        has_responses = True
-                        break
-                if has_responses:
-                    break
+            # Skip papers without responses before scanning them for discussions
+            if not (
+                paper_data.get("excluded_from_full_text_review", False)
+                or self._has_any_response(responses)
+            ):
+                continue
 
             # Detect whether this paper has at least one open discussion entry
-            has_open_discussion = False
-            for question_responses in responses.values():
-                for selection_list in question_responses.values():
-                    if any(
-                        isinstance(selection, str)
-                        and selection.startswith("Discussion needed")
-                        for selection in selection_list
-                    ):
-                        has_open_discussion = True
-                        break
-                if has_open_discussion:
-                    break
-
-            # Add to finished list if it has responses
-            if has_responses or paper_data.get("excluded_from_full_text_review", False):
-                entry_data = self.papers.get(paper_key, {})
-                finished.append(
-                    (
-                        paper_key,
-                        entry_data.get("title", "Unknown"),
-                        entry_data.get("authors", "Unknown"),
-                        entry_data.get("year", "Unknown"),
-                        has_open_discussion,
-                    )
+            has_open_discussion = any(
+                isinstance(selection, str) and selection.startswith("Discussion needed")
+                for question_responses in responses.values()
+                for selection_list in question_responses.values()
+                for selection in selection_list
+            )
+
+            entry_data = self.papers.get(paper_key, {})
+            finished.append(
+                (
+                    paper_key,
+                    entry_data.get("title", "Unknown"),
+                    entry_data.get("authors", "Unknown"),
+                    entry_data.get("year", "Unknown"),
+                    has_open_discussion,
                 )
+            )
 
         return finished
 
@@ -447,13 +778,13 @@ class DataExtractionGUI(QMainWindow):
             selected_key = dialog.get_selected_paper_key()
             if selected_key:
                 # Find index of selected paper
-                try:
-                    index = self.paper_keys.index(selected_key)
-                    self.load_paper(index)
-                except ValueError:
+                index = self._paper_index_by_key.get(selected_key)
+                if index is None:
                     QMessageBox.warning(
                         self, "Error", "Could not find the selected paper."
                     )
+                else:
+                    self.load_paper(index)
 
     def init_ui(self) -> None:
         """Initialize the user interface."""
@@ -464,10 +795,7 @@ class DataExtractionGUI(QMainWindow):
         main_layout = QVBoxLayout()
 
         title_label = QLabel("Research Data Extraction Tool")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_font(14, bold=True))
         main_layout.addWidget(title_label)
 
         # Paper info section
@@ -476,12 +804,8 @@ class DataExtractionGUI(QMainWindow):
         paper_info_layout.setContentsMargins(0, 0, 0, 0)
 
         self.paper_info_label = QLabel()
-        info_font = QFont()
-        info_font.setPointSize(9)
-        self.paper_info_label.setFont(info_font)
-        self.paper_info_label.setStyleSheet(
-            "background-color: #2c3e50; color: #ecf0f1; padding: 10px; border-radius: 5px; border: 1px solid #1a252f;"
-        )
+        self.paper_info_label.setFont(_font(9))
+        self.paper_info_label.setStyleSheet(_QSS_PAPER_INFO)
         self.paper_info_label.setWordWrap(True)
         self.paper_info_label.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse
@@ -493,23 +817,15 @@ class DataExtractionGUI(QMainWindow):
         self.exclude_checkbox = QCheckBox(
             "⚠️ Exclude from full text review (irrelevant for research questions)"
         )
-        exclude_font = QFont()
-        exclude_font.setPointSize(9)
-        exclude_font.setBold(True)
-        self.exclude_checkbox.setFont(exclude_font)
-        self.exclude_checkbox.setStyleSheet(
-            "QCheckBox { color: #d9534f; padding: 5px; }"
-        )
+        self.exclude_checkbox.setFont(_font(9, bold=True))
+        self.exclude_checkbox.setStyleSheet(_QSS_EXCLUDE_CHECKBOX)
         self.exclude_checkbox.stateChanged.connect(self.on_exclude_changed)
         paper_info_layout.addWidget(self.exclude_checkbox)
 
         # Exclusion reason text field
         reason_label = QLabel("Reason for exclusion:")
-        reason_font = QFont()
-        reason_font.setPointSize(8)
-        reason_font.setItalic(True)
-        reason_label.setFont(reason_font)
-        reason_label.setStyleSheet("color: #666666; padding: 5px 0px 2px 20px;")
+        reason_label.setFont(_font(8, italic=True))
+        reason_label.setStyleSheet(_QSS_EXCLUDE_REASON_LABEL)
         reason_label.setVisible(False)
         paper_info_layout.addWidget(reason_label)
 
@@ -518,11 +834,10 @@ class DataExtractionGUI(QMainWindow):
             "e.g., 'Out of scope', 'Duplicate', 'Irrelevant methodology'"
         )
         self.exclude_reason_input.setMaximumHeight(30)
-        self.exclude_reason_input.setStyleSheet(
-            "QLineEdit { background-color: #f9f9f9; color: #999999; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; margin-left: 20px; }"
-        )
+        self.exclude_reason_input.setStyleSheet(_QSS_EXCLUDE_REASON_INACTIVE)
         self.exclude_reason_input.setVisible(False)
         self.exclude_reason_input.setEnabled(False)
+        self._last_excluded_style = False
         self.exclude_reason_input.textChanged.connect(self.on_exclude_reason_changed)
         self.exclude_reason_label = (
             reason_label  # Store reference for toggling visibility
@@ -534,6 +849,8 @@ class DataExtractionGUI(QMainWindow):
 
         # Nested tabs for research questions
         self.question_tabs = QTabWidget()
+        # Tab contents are only built once a tab is shown
+        self.question_tabs.currentChanged.connect(self._build_question_tab_contents)
         main_layout.addWidget(self.question_tabs)
 
         # Create button layout
@@ -563,16 +880,22 @@ class DataExtractionGUI(QMainWindow):
 
         # Progress indicator
         self.progress_label = QLabel()
-        progress_font = QFont()
-        progress_font.setPointSize(9)
-        progress_font.setItalic(True)
-        self.progress_label.setFont(progress_font)
+        self.progress_label.setFont(_font(9, italic=True))
         self.progress_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         main_layout.addWidget(self.progress_label)
 
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
 
+        # Status bar for short notices that should not interrupt the user
+        self.statusBar()
+
+        # Session state is saved once paper switches settle instead of on every switch
+        self._session_timer = QTimer(self)
+        self._session_timer.setSingleShot(True)
+        self._session_timer.setInterval(500)
+        self._session_timer.timeout.connect(self._flush_session_state)
+
         # Find and load the first unprocessed paper
         start_index = self.find_first_unprocessed_paper()
         self.load_paper(start_index)
@@ -583,7 +906,7 @@ class DataExtractionGUI(QMainWindow):
         Automatically exports data and saves session state before closing the application.
         """
         self._perform_export()
-        self._save_session_state()
+        self._flush_session_state()
         self.close()
 
     def closeEvent(self, a0: Optional[QCloseEvent]) -> None:
@@ -592,7 +915,7 @@ class DataExtractionGUI(QMainWindow):
         Automatically exports data and saves session state when the window is closed.
         """
         self._perform_export()
-        self._save_session_state()
+        self._flush_session_state()
         if a0:
             a0.accept()
 
@@ -621,39 +944,41 @@ class DataExtractionGUI(QMainWindow):
         info_text = f"Title: {paper_title}\nAuthors: {paper_authors}\nYear: {paper_year}\nUser: {self.user}"
         self.paper_info_label.setText(info_text)
 
-        # Update exclude checkbox state
+        # Update exclude checkbox state (only touch widgets whose state actually changes)
         if self.exclude_checkbox is not None:
             is_excluded = self.excluded_papers.get(entry_key, False)
-            self.exclude_checkbox.blockSignals(True)
-            self.exclude_checkbox.setChecked(is_excluded)
-            self.exclude_checkbox.blockSignals(False)
+            if self.exclude_checkbox.isChecked() != is_excluded:
+                with QSignalBlocker(self.exclude_checkbox):
+                    self.exclude_checkbox.setChecked(is_excluded)
 
             # Enable/disable question tabs based on exclusion status
-            if self.question_tabs is not None:
+            if (
+                self.question_tabs is not None
+                and self.question_tabs.isEnabled() == is_excluded
+            ):
                 self.question_tabs.setEnabled(not is_excluded)
 
             # Update reason field visibility and content
             if self.exclude_reason_input is not None:
-                self.exclude_reason_input.setVisible(is_excluded)
-                self.exclude_reason_label.setVisible(is_excluded)
                 if is_excluded:
                     previous_reason = self.excluded_reasons.get(entry_key, "")
-                    self.exclude_reason_input.blockSignals(True)
-                    self.exclude_reason_input.setText(previous_reason)
-                    self.exclude_reason_input.blockSignals(False)
-                    self.exclude_reason_input.setEnabled(True)
-                    self.exclude_reason_input.setStyleSheet(
-                        "QLineEdit { background-color: white; color: #333333; border: 1px solid #d9534f; border-radius: 3px; padding: 5px; margin-left: 20px; }"
-                    )
-                else:
-                    self.exclude_reason_input.setEnabled(False)
-                    self.exclude_reason_input.setStyleSheet(
-                        "QLineEdit { background-color: #f9f9f9; color: #999999; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; margin-left: 20px; }"
-                    )
+                    with QSignalBlocker(self.exclude_reason_input):
+                        self.exclude_reason_input.setText(previous_reason)
+                self._apply_exclude_reason_state(is_excluded)
 
-        # Clear and recreate question tabs
+        # Clear and recreate question tabs; repaints are suspended until the rebuild is done
         if self.question_tabs is not None:
-            self.question_tabs.clear()
+            self.question_tabs.setUpdatesEnabled(False)
+            # QTabWidget.clear() does not delete the pages, so the previous paper's
+            # widget trees are released explicitly instead of piling up per paper
+            old_pages = [
+                self.question_tabs.widget(i) for i in range(self.question_tabs.count())
+            ]
+            # No tab is built while the old pages are removed
+            with QSignalBlocker(self.question_tabs):
+                self.question_tabs.clear()
+            for page in old_pages:
+                page.deleteLater()
         self.checkboxes.clear()
         self.text_inputs.clear()
         self.radio_buttons.clear()
@@ -664,46 +989,63 @@ class DataExtractionGUI(QMainWindow):
         self.toggle_buttons.clear()
         self.toggle_line_edits.clear()
         self.mandatory_text_inputs.clear()
+        self._selected_values_layouts.clear()
+        self._selected_value_rows.clear()
+        self._discussion_state.clear()
+        self._built_question_tabs.clear()
+
+        # The paper can be edited from now on, so it has to be exported again
+        self._export_dirty.add(entry_key)
 
         # Initialize tracking for this paper if not already done
         if entry_key not in self.selected_values:
-            self.selected_values[entry_key] = {}
-            self.selected_Other_text[entry_key] = {}
-            self.toggle_states[entry_key] = {}
+            self._ensure_paper_state(entry_key)
             # Load previous progress from export file
             self._load_paper_progress(entry_key)
 
         # Create nested tabs for research questions
+        # Only placeholders are added here; the current tab is filled in right away and
+        # the others when they are first shown (see _build_question_tab_contents)
+        for question_key, attribute_specs in self._question_schema.items():
+            self._ensure_question_state(entry_key, question_key, attribute_specs)
         if self.question_tabs is not None:
-            for question_key, options_dict in self.data.items():
-                question_tab = self.create_question_tab(
-                    entry_key, question_key, options_dict
-                )
-                self.question_tabs.addTab(question_tab, question_key)
+            with QSignalBlocker(self.question_tabs):
+                for question_key in self._question_schema:
+                    placeholder = QWidget()
+                    placeholder.setProperty("question_key", question_key)
+                    placeholder_layout = QVBoxLayout(placeholder)
+                    placeholder_layout.setContentsMargins(0, 0, 0, 0)
+                    self.question_tabs.addTab(placeholder, question_key)
+            self._build_question_tab_contents(self.question_tabs.currentIndex())
+            self.question_tabs.setUpdatesEnabled(True)
 
         # Update progress label
         progress_text = f"Paper {index + 1} of {len(self.paper_keys)}"
         self.progress_label.setText(progress_text)
 
-        # Save current session state
+        # Schedule saving the current session state
         self._save_session_state()
 
-    def _load_paper_progress(self, entry_key: str) -> None:
-        """Load previously saved progress for a paper from the export file.
+    def _ensure_paper_state(self, entry_key: str) -> None:
+        """Create the per-paper state containers for a paper if they do not exist yet.
+
+        The Other text, toggle and mandatory text containers are defaultdicts and
+        create their per-paper and per-question levels on first access; the paper's
+        selected values create their per-question level on first access.
 
         Args:
             entry_key (str): The BIB entry key for the paper.
         """
-        export_file = "export.json"
-        if not os.path.exists(export_file):
-            return
+        if entry_key not in self.selected_values:
+            self.selected_values[entry_key] = defaultdict(dict)
 
-        try:
-            with open(export_file, "r") as f:
-                exported_data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return
+    def _load_paper_progress(self, entry_key: str) -> None:
+        """Load previously saved progress for a paper from the export file.
 
+        Args:
+            entry_key (str): The BIB entry key for the paper.
+        """
+        exported_data = self._get_exported_data()
         if entry_key not in exported_data:
             return
 
@@ -720,20 +1062,12 @@ class DataExtractionGUI(QMainWindow):
         # Restore toggle states and texts (format in export: question_key -> attribute -> {"enabled": bool, "text": str})
         toggle_data = paper_data.get("toggle_states", {})
         if toggle_data:
-            if entry_key not in self.toggle_states:
-                self.toggle_states[entry_key] = {}
-            if entry_key not in self.toggle_texts:
-                self.toggle_texts[entry_key] = {}
             for question_key, attrs in toggle_data.items():
-                if question_key not in self.toggle_states[entry_key]:
-                    self.toggle_states[entry_key][question_key] = {}
-                if question_key not in self.toggle_texts[entry_key]:
-                    self.toggle_texts[entry_key][question_key] = {}
                 for attribute, val in attrs.items():
                     # val can be a dict with enabled/text or a simple boolean (legacy)
                     if isinstance(val, dict):
                         enabled = bool(val.get("enabled", True))
-                        text = str(val.get("text", ""))
+                        text = str(val.get("text", "")).strip()
                     else:
                         enabled = bool(val)
                         text = ""
@@ -743,22 +1077,16 @@ class DataExtractionGUI(QMainWindow):
         # Restore mandatory texts (format in export: question_key -> attribute -> text)
         mandatory_data = paper_data.get("mandatory_texts", {})
         if mandatory_data:
-            if entry_key not in self.mandatory_texts:
-                self.mandatory_texts[entry_key] = {}
             for question_key, attrs in mandatory_data.items():
-                if question_key not in self.mandatory_texts[entry_key]:
-                    self.mandatory_texts[entry_key][question_key] = {}
                 for attribute, text in attrs.items():
-                    self.mandatory_texts[entry_key][question_key][attribute] = text
+                    self.mandatory_texts[entry_key][question_key][
+                        attribute
+                    ] = text.strip()
 
         responses = paper_data.get("responses", {})
 
         # Reconstruct the selections from the exported data
         for question_key in responses:
-            if question_key not in self.selected_values[entry_key]:
-                self.selected_values[entry_key][question_key] = {}
-                self.selected_Other_text[entry_key][question_key] = {}
-
             for attribute, selections in responses[question_key].items():
                 if attribute not in self.selected_values[entry_key][question_key]:
                     self.selected_values[entry_key][question_key][attribute] = []
@@ -766,20 +1094,18 @@ class DataExtractionGUI(QMainWindow):
 
                 # Parse selections and reconstruct them
                 for selection in selections:
-                    if selection.startswith("Other: "):
+                    if selection.startswith(_OTHER_PREFIX):
                         # Extract "Other" text
-                        Other_text = selection[7:]  # Remove "Other: " prefix
+                        Other_text = selection[len(_OTHER_PREFIX) :]
                         self.selected_values[entry_key][question_key][attribute].append(
                             "Other"
                         )
                         self.selected_Other_text[entry_key][question_key][
                             attribute
                         ] = Other_text
-                    elif selection.startswith("Discussion needed: "):
+                    elif selection.startswith(_DISCUSSION_PREFIX):
                         # Extract discussion text
-                        discussion_text = selection[
-                            19:
-                        ]  # Remove "Discussion needed: " prefix
+                        discussion_text = selection[len(_DISCUSSION_PREFIX) :]
                         self.selected_values[entry_key][question_key][attribute].append(
                             "Discussion needed"
                         )
@@ -787,21 +1113,22 @@ class DataExtractionGUI(QMainWindow):
                             f"{entry_key}_{question_key}_{attribute}_discussion"
                         )
                         # Store in state (will be applied when widgets are created)
-                        if (
-                            attribute
-                            not in self.selected_Other_text[entry_key][question_key]
-                        ):
-                            self.selected_Other_text[entry_key][question_key][
-                                attribute
-                            ] = ""
-                        self.discussion_texts[discussion_key] = discussion_text
+                        self.discussion_texts[discussion_key] = discussion_text.strip()
                     else:
                         self.selected_values[entry_key][question_key][attribute].append(
                             selection
                         )
 
     def _save_session_state(self) -> None:
-        """Save the current session state to allow resuming incomplete work."""
+        """Schedule saving the current session state to allow resuming incomplete work.
+
+        Repeated calls within the timer interval result in a single write.
+        """
+        self._session_timer.start()
+
+    def _flush_session_state(self) -> None:
+        """Write the current session state to disk right away."""
+        self._session_timer.stop()
         session_file = ".session.json"
         try:
             session_data = {
@@ -813,8 +1140,7 @@ class DataExtractionGUI(QMainWindow):
                     else None
                 ),
             }
-            with open(session_file, "w") as f:
-                json.dump(session_data, f, indent=2)
+            _dump_json_file(session_file, session_data)
         except IOError:
             pass  # Silently fail if we can't save session
 
@@ -835,22 +1161,16 @@ class DataExtractionGUI(QMainWindow):
         if not self.validate_all_required_fields():
             return
 
-        # First, write current selections to export.json (silent)
-        self._perform_export()
-
-        # Load the just-exported paper data and run sanity checks defined in sanity_checks.json
-        try:
-            with open("export.json", "r") as f:
-                exported = json.load(f)
-        except (IOError, json.JSONDecodeError):
-            exported = {}
+        # First, write current selections to export.json (silent) and keep the exported data
+        exported = self._perform_export() or {}
 
+        # Run sanity checks defined in sanity_checks.json on the just-exported paper data
         paper_entry = exported.get(entry_key, {})
 
         violations = []
         try:
             violations = sanity_checks.validate_paper(
-                paper_entry, config_path=str(pathlib.Path("sanity_checks.json"))
+                paper_entry, rules=self._sanity_rules
             )
         except Exception as e:
             # If the validator fails unexpectedly, surface an error and abort finishing so user can investigate
@@ -893,178 +1213,153 @@ class DataExtractionGUI(QMainWindow):
         if self.excluded_papers.get(entry_key, False):
             return True
 
-        # Check each research question
-        for question_key, options_dict in self.data.items():
-            # Check each attribute (category) in the question
-            for attribute in options_dict.keys():
-                # Get selections for this attribute
-                selections = (
-                    self.selected_values[entry_key]
-                    .get(question_key, {})
-                    .get(attribute, [])
-                )
+        # The state of every question is initialized in load_paper, so index directly
+        paper_selections = self.selected_values[entry_key]
+
+        # Check that at least one item is selected in every category, stopping at the first gap
+        first_missing = next(
+            (
+                (question_key, spec.attribute)
+                for question_key, attribute_specs in self._question_schema.items()
+                for spec in attribute_specs
+                if not paper_selections[question_key][spec.attribute]
+            ),
+            None,
+        )
+        if first_missing is not None:
+            # Show error message with details
+            question_key, attribute = first_missing
+            missing_info = f"Research Question: {question_key}\nCategory: {attribute}"
+            QMessageBox.warning(
+                self,
+                "Incomplete Data",
+                f"Please select at least one item for:\n\n{missing_info}",
+            )
+            return False
 
-                # Check if at least one item is selected
-                if not selections:
-                    # Show error message with details
-                    missing_info = (
-                        f"Research Question: {question_key}\nCategory: {attribute}"
-                    )
-                    QMessageBox.warning(
-                        self,
-                        "Incomplete Data",
-                        f"Please select at least one item for:\n\n{missing_info}",
-                    )
-                    return False
+        # Check the text fields that depend on the selections of each research question
+        for question_key, attribute_specs in self._question_schema.items():
+            question_selections = paper_selections[question_key]
+            # Check each attribute (category) in the question
+            for spec in attribute_specs:
+                attribute = spec.attribute
+                selections = question_selections[attribute]
 
                 # If "Discussion needed" is selected, check that discussion text is provided
                 if "Discussion needed" in selections:
                     discussion_key = (
                         f"{entry_key}_{question_key}_{attribute}_discussion"
                     )
-                    if discussion_key in self.discussion_text_inputs:
-                        discussion_text = (
-                            self.discussion_text_inputs[discussion_key].text().strip()
+                    # The stored text is stripped when it changes
+                    if not self.discussion_texts.get(discussion_key):
+                        missing_info = (
+                            f"Research Question: {question_key}\nCategory: {attribute}"
                         )
-                        if not discussion_text:
-                            missing_info = f"Research Question: {question_key}\nCategory: {attribute}"
-                            QMessageBox.warning(
-                                self,
-                                "Discussion Text Required",
-                                f"Since 'Discussion needed' is selected for:\n\n{missing_info}\n\nPlease provide a discussion explanation in the text field.",
-                            )
-                            return False
-
-                # Check if mandatory text field is required and filled
-                options = options_dict.get(attribute)
-                if isinstance(options, dict):
-                    mandatory_text_config = options.get("mandatory_text_field", None)
-                    if mandatory_text_config and mandatory_text_config.get(
-                        "enabled", False
-                    ):
-                        # If any selection is made, mandatory text must be provided
-                        if selections:  # There are selections
-                            mandatory_text = (
-                                self.mandatory_texts.get(entry_key, {})
-                                .get(question_key, {})
-                                .get(attribute, "")
-                                .strip()
-                            )
-                            if not mandatory_text:
-                                missing_info = f"Research Question: {question_key}\nCategory: {attribute}"
-                                field_label = mandatory_text_config.get(
-                                    "label", "Additional information"
-                                )
-                                QMessageBox.warning(
-                                    self,
-                                    "Required Text Missing",
-                                    f"For:\n\n{missing_info}\n\nPlease provide: {field_label}",
-                                )
-                                return False
+                        QMessageBox.warning(
+                            self,
+                            "Discussion Text Required",
+                            f"Since 'Discussion needed' is selected for:\n\n{missing_info}\n\nPlease provide a discussion explanation in the text field.",
+                        )
+                        return False
+
+                # Check if mandatory text field is required and filled; every category has
+                # a selection at this point, so the text must be provided
+                mandatory_text_config = spec.mandatory_text_config
+                if mandatory_text_config:
+                    if not self.mandatory_texts[entry_key][question_key].get(attribute):
+                        missing_info = (
+                            f"Research Question: {question_key}\nCategory: {attribute}"
+                        )
+                        field_label = mandatory_text_config.get(
+                            "label", "Additional information"
+                        )
+                        QMessageBox.warning(
+                            self,
+                            "Required Text Missing",
+                            f"For:\n\n{missing_info}\n\nPlease provide: {field_label}",
+                        )
+                        return False
 
         return True
 
+    def _ensure_question_state(
+        self, entry_key: str, question_key: str, attribute_specs: List[AttributeSpec]
+    ) -> None:
+        """Initialize the tracking structures of a research question for a paper.
+
+        Args:
+            entry_key (str): The BIB entry key for the paper.
+            question_key (str): The research question identifier.
+            attribute_specs (List[AttributeSpec]): Parsed configuration of the question's attributes.
+        """
+        # Toggle states are not filled in here: they stay sparse, holding only toggles
+        # that were set, so the export does not walk every attribute of every question
+        question_values = self.selected_values[entry_key][question_key]
+        for spec in attribute_specs:
+            if spec.attribute not in question_values:
+                question_values[spec.attribute] = []
+                self.selected_Other_text[entry_key][question_key][spec.attribute] = ""
+
+    def _build_question_tab_contents(self, index: int) -> None:
+        """Build the widgets of a question tab the first time it is shown.
+
+        Args:
+            index (int): Index of the tab in the question tabs.
+        """
+        if self.question_tabs is None or index < 0:
+            return
+        placeholder = self.question_tabs.widget(index)
+        if placeholder is None:
+            return
+        question_key = placeholder.property("question_key")
+        if question_key in self._built_question_tabs:
+            return
+        self._built_question_tabs.add(question_key)
+
+        entry_key = self.paper_keys[self.current_paper_index]
+        question_tab = self.create_question_tab(
+            entry_key, question_key, self._question_schema[question_key]
+        )
+        placeholder.layout().addWidget(question_tab)
+
     def create_question_tab(
-        self, entry_key: str, question_key: str, options_dict: Dict[str, List[str]]
+        self, entry_key: str, question_key: str, attribute_specs: List[AttributeSpec]
     ) -> QWidget:
         """Create a tab for a single research question within a paper.
 
         Args:
             entry_key (str): The BIB entry key for the paper.
             question_key (str): The research question identifier.
-            options_dict (Dict[str, List[str]]): Dictionary of attributes and their options.
+            attribute_specs (List[AttributeSpec]): Parsed configuration of the question's attributes.
 
         Returns:
             QWidget: The constructed tab widget.
         """
-        # Initialize tracking for this question
-        if question_key not in self.selected_values[entry_key]:
-            self.selected_values[entry_key][question_key] = {}
-            self.selected_Other_text[entry_key][question_key] = {}
-            # Ensure toggle structures exist for this paper/question
-            if entry_key not in self.toggle_states:
-                self.toggle_states[entry_key] = {}
-            if question_key not in self.toggle_states[entry_key]:
-                self.toggle_states[entry_key][question_key] = {}
-            if entry_key not in self.toggle_texts:
-                self.toggle_texts[entry_key] = {}
-            if question_key not in self.toggle_texts[entry_key]:
-                self.toggle_texts[entry_key][question_key] = {}
-            if entry_key not in self.mandatory_texts:
-                self.mandatory_texts[entry_key] = {}
-            if question_key not in self.mandatory_texts[entry_key]:
-                self.mandatory_texts[entry_key][question_key] = {}
-
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { background-color: white; }")
+        scroll.setStyleSheet(_QSS_WHITE_SCROLL_AREA)
 
         container = QWidget()
-        container.setStyleSheet("QWidget { background-color: white; }")
+        container.setStyleSheet(_QSS_QUESTION_TAB)
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(5)
 
         # Create grid for attributes
-        for attribute, options in options_dict.items():
-            # Initialize tracking for this attribute
-            if attribute not in self.selected_values[entry_key][question_key]:
-                self.selected_values[entry_key][question_key][attribute] = []
-                self.selected_Other_text[entry_key][question_key][attribute] = ""
-
-            # Initialize toggle state for this attribute if needed
-            if question_key not in self.toggle_states[entry_key]:
-                self.toggle_states[entry_key][question_key] = {}
-            if attribute not in self.toggle_states[entry_key][question_key]:
-                self.toggle_states[entry_key][question_key][attribute] = False
-
-            # Parse options format - handle both old list format and new dict format
-            toggle_config = None
-            mandatory_text_config = None
-            if isinstance(options, dict):
-                # New format with "options" and optionally "toggle_option" or "mandatory_text_field"
-                display_options_base = options.get("options", [])
-                toggle_config = options.get("toggle_option", None)
-                # Check if toggle_option is enabled
-                if toggle_config and not toggle_config.get("enabled", False):
-                    toggle_config = None
-                mandatory_text_config = options.get("mandatory_text_field", None)
-                # Check if mandatory_text_field is enabled
-                if mandatory_text_config and not mandatory_text_config.get(
-                    "enabled", False
-                ):
-                    mandatory_text_config = None
-            else:
-                # Old list format
-                display_options_base = options if isinstance(options, list) else []
+        for spec in attribute_specs:
+            attribute = spec.attribute
+            display_options = spec.display_options
+            toggle_config = spec.toggle_config
+            mandatory_text_config = spec.mandatory_text_config
 
             # Attribute label
             attr_label = QLabel(f"{attribute}:")
-            attr_font = QFont()
-            attr_font.setBold(True)
-            attr_font.setPointSize(10)
-            attr_label.setFont(attr_font)
-            attr_label.setStyleSheet("color: #1a1a1a; padding: 5px 0px;")
+            attr_label.setFont(_font(10, bold=True))
+            attr_label.setProperty("qssClass", "attribute")
             layout.addWidget(attr_label)
 
-            # Check if this is a single-choice item or multiple selection item
-            is_single_choice = "single-choice" in display_options_base
-            is_multiple = "Multiple" in display_options_base
-
-            # Remove "single-choice" and "Multiple" markers from options list for display
-            display_options = [
-                opt
-                for opt in display_options_base
-                if opt not in ("single-choice", "Multiple")
-            ]
-
-            display_options.append("Underspecified")
-            # Add "Discussion needed" as an option for all attributes
-            if "Discussion needed" not in display_options:
-                display_options.append("Discussion needed")
-
             # Choose widget type based on number of options and markers
-            if is_multiple:
+            if spec.is_multiple:
                 # Use special multiple selection widget
                 self._create_multiple_selection_widget(
                     layout, entry_key, question_key, attribute, display_options
@@ -1074,7 +1369,7 @@ class DataExtractionGUI(QMainWindow):
                 self._create_dropdown_widget(
                     layout, entry_key, question_key, attribute, display_options
                 )
-            elif is_single_choice:
+            elif spec.is_single_choice:
                 # Use radio buttons for single-choice items
                 self._create_radio_buttons(
                     layout, entry_key, question_key, attribute, display_options
@@ -1086,24 +1381,17 @@ class DataExtractionGUI(QMainWindow):
                 )
 
             # Text input for "Other" option if it exists in original options
-            if "Other" in display_options_base:
+            if spec.has_other:
                 text_label = QLabel("Please specify:")
-                text_label.setStyleSheet(
-                    "color: #555555; font-weight: bold; padding: 5px 0px;"
-                )
+                text_label.setProperty("qssClass", "field")
                 layout.addWidget(text_label)
 
                 text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
                 text_input = QLineEdit()
                 text_input.setEnabled(False)
-                text_input.setStyleSheet(
-                    "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
-                )
-                text_input.textChanged.connect(
-                    lambda text, e=entry_key, q=question_key, a=attribute: self.on_Other_text_changed(
-                        e, q, a, text
-                    )
-                )
+                text_input.setStyleSheet(_QSS_LINE_EDIT_DISABLED)
+                text_input.setProperty("ctx", (entry_key, question_key, attribute))
+                text_input.textChanged.connect(self._on_Other_text_signal)
                 self.text_inputs[text_input_key] = text_input
                 layout.addWidget(text_input)
                 layout.addSpacing(5)
@@ -1113,14 +1401,9 @@ class DataExtractionGUI(QMainWindow):
                 toggle_label = toggle_config.get("label", "Toggle")
                 toggle_key = f"{entry_key}_{question_key}_{attribute}_toggle"
                 toggle_button = QCheckBox(toggle_label)
-                toggle_button.setStyleSheet(
-                    "QCheckBox { color: #1976d2; font-weight: bold; padding: 5px 0px; }"
-                )
-                toggle_button.stateChanged.connect(
-                    lambda state, e=entry_key, q=question_key, a=attribute: self.on_toggle_changed(
-                        e, q, a, state
-                    )
-                )
+                toggle_button.setProperty("qssClass", "toggle")
+                toggle_button.setProperty("ctx", (entry_key, question_key, attribute))
+                toggle_button.stateChanged.connect(self._on_toggle_signal)
                 self.toggle_buttons[toggle_key] = toggle_button
                 layout.addWidget(toggle_button)
 
@@ -1129,14 +1412,11 @@ class DataExtractionGUI(QMainWindow):
                 toggle_text_input = QLineEdit()
                 toggle_text_input.setEnabled(False)
                 toggle_text_input.setPlaceholderText("Enter additional info...")
-                toggle_text_input.setStyleSheet(
-                    "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
-                )
-                toggle_text_input.textChanged.connect(
-                    lambda text, e=entry_key, q=question_key, a=attribute: self.on_toggle_text_changed(
-                        e, q, a, text
-                    )
+                toggle_text_input.setStyleSheet(_QSS_LINE_EDIT_DISABLED)
+                toggle_text_input.setProperty(
+                    "ctx", (entry_key, question_key, attribute)
                 )
+                toggle_text_input.textChanged.connect(self._on_toggle_text_signal)
                 self.toggle_line_edits[toggle_text_key] = toggle_text_input
                 layout.addWidget(toggle_text_input)
                 layout.addSpacing(5)
@@ -1152,23 +1432,18 @@ class DataExtractionGUI(QMainWindow):
 
                 # Label
                 mandatory_field_label = QLabel(f"{mandatory_label}:")
-                mandatory_field_label.setStyleSheet(
-                    "color: #555555; font-weight: bold; padding: 5px 0px;"
-                )
+                mandatory_field_label.setProperty("qssClass", "field")
                 layout.addWidget(mandatory_field_label)
 
                 # Text input
                 mandatory_text_key = f"{entry_key}_{question_key}_{attribute}_mandatory"
                 mandatory_text_input = QLineEdit()
                 mandatory_text_input.setPlaceholderText(mandatory_placeholder)
-                mandatory_text_input.setStyleSheet(
-                    "QLineEdit { background-color: white; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #333333; }"
-                )
-                mandatory_text_input.textChanged.connect(
-                    lambda text, e=entry_key, q=question_key, a=attribute: self.on_mandatory_text_changed(
-                        e, q, a, text
-                    )
+                mandatory_text_input.setProperty("qssClass", "mandatory")
+                mandatory_text_input.setProperty(
+                    "ctx", (entry_key, question_key, attribute)
                 )
+                mandatory_text_input.textChanged.connect(self._on_mandatory_text_signal)
                 self.mandatory_text_inputs[mandatory_text_key] = mandatory_text_input
                 layout.addWidget(mandatory_text_input)
                 layout.addSpacing(5)
@@ -1178,7 +1453,7 @@ class DataExtractionGUI(QMainWindow):
             separator.setFrameShape(QFrame.Shape.HLine)
             separator.setFrameShadow(QFrame.Shadow.Plain)
             separator.setLineWidth(1)
-            separator.setStyleSheet("QFrame { border: 1px solid #e0e0e0; }")
+            separator.setProperty("qssClass", "separator")
             layout.addWidget(separator)
 
             # Spacing
@@ -1198,28 +1473,36 @@ class DataExtractionGUI(QMainWindow):
     ) -> None:
         """Restore the UI state based on loaded progress data.
 
+        The widgets' signals are blocked while they are restored, since the stored state
+        is already up to date; the side effects of the handlers are applied directly.
+
         Args:
             layout (QVBoxLayout): The layout containing the UI widgets.
             entry_key (str): The BIB entry key for the paper.
             question_key (str): The research question identifier.
         """
-        if (
-            entry_key not in self.selected_values
-            or question_key not in self.selected_values[entry_key]
-        ):
-            return
-
-        for attribute in self.selected_values[entry_key][question_key]:
-            selections = self.selected_values[entry_key][question_key][attribute]
+        # load_paper initializes the state of every question, so resolve the
+        # per-question dicts once instead of walking entry -> question on every access
+        question_values = self.selected_values[entry_key][question_key]
+        question_Other_texts = self.selected_Other_text[entry_key][question_key]
+        question_toggles = self.toggle_states[entry_key][question_key]
+        question_toggle_texts = self.toggle_texts[entry_key][question_key]
+        question_mandatory_texts = self.mandatory_texts[entry_key][question_key]
+
+        for attribute, selections in question_values.items():
+            # All widget keys of the attribute share this prefix
+            key_prefix = f"{entry_key}_{question_key}_{attribute}"
 
             # Restore checkbox state
             for selection in selections:
-                checkbox_key = f"{entry_key}_{question_key}_{attribute}_{selection}"
-                if checkbox_key in self.checkboxes:
-                    self.checkboxes[checkbox_key].setChecked(True)
+                checkbox_key = f"{key_prefix}_{selection}"
+                checkbox = self.checkboxes.get(checkbox_key)
+                if checkbox is not None:
+                    with QSignalBlocker(checkbox):
+                        checkbox.setChecked(True)
 
             # Restore multiple selection state
-            multiple_combo_key = f"{entry_key}_{question_key}_{attribute}_multiple"
+            multiple_combo_key = f"{key_prefix}_multiple"
             if multiple_combo_key in self.comboboxes:
                 # Update the display of selected values
                 self._update_multiple_selection_display(
@@ -1227,88 +1510,80 @@ class DataExtractionGUI(QMainWindow):
                 )
 
             # Restore radio button state
-            group_key = f"{entry_key}_{question_key}_{attribute}"
-            if group_key in self.radio_button_groups and selections:
+            if key_prefix in self.radio_button_groups and selections:
                 # For radio buttons, only the last selection is active
                 selection = selections[0]
-                radio_key = f"{entry_key}_{question_key}_{attribute}_{selection}"
-                if radio_key in self.radio_buttons:
-                    self.radio_buttons[radio_key].setChecked(True)
+                radio_key = f"{key_prefix}_{selection}"
+                radio = self.radio_buttons.get(radio_key)
+                if radio is not None:
+                    with QSignalBlocker(radio):
+                        radio.setChecked(True)
 
             # Restore dropdown state
-            combo_key = f"{entry_key}_{question_key}_{attribute}"
-            if combo_key in self.comboboxes and selections:
-                combo = self.comboboxes[combo_key]
-                combo.setCurrentText(selections[0])
+            if key_prefix in self.comboboxes and selections:
+                combo = self.comboboxes[key_prefix]
+                with QSignalBlocker(combo):
+                    combo.setCurrentIndex(
+                        self._combo_index[(question_key, attribute)].get(
+                            selections[0], 0
+                        )
+                    )
 
             # Restore "Other" text if present
             if "Other" in selections:
-                text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
-                if text_input_key in self.text_inputs:
-                    self.text_inputs[text_input_key].setText(
-                        self.selected_Other_text[entry_key][question_key][attribute]
-                    )
-                    self.text_inputs[text_input_key].setEnabled(True)
+                text_input_key = f"{key_prefix}_Other"
+                text_input = self.text_inputs.get(text_input_key)
+                if text_input is not None:
+                    with QSignalBlocker(text_input):
+                        text_input.setText(question_Other_texts[attribute])
+                    text_input.setEnabled(True)
+                    text_input.setStyleSheet(_QSS_LINE_EDIT_ENABLED)
 
             # Restore "Discussion needed" text if present
             if "Discussion needed" in selections:
-                discussion_key = f"{entry_key}_{question_key}_{attribute}_discussion"
+                discussion_key = f"{key_prefix}_discussion"
                 if discussion_key in self.discussion_text_inputs:
                     self._set_discussion_field_state(
                         entry_key, question_key, attribute, True, clear_text=False
                     )
                     if discussion_key in self.discussion_texts:
-                        self.discussion_text_inputs[discussion_key].setText(
-                            self.discussion_texts[discussion_key]
-                        )
+                        discussion_input = self.discussion_text_inputs[discussion_key]
+                        with QSignalBlocker(discussion_input):
+                            discussion_input.setText(
+                                self.discussion_texts[discussion_key]
+                            )
 
             # Restore toggle state and its text if present
-            toggle_key = f"{entry_key}_{question_key}_{attribute}_toggle"
-            toggle_text_key = f"{entry_key}_{question_key}_{attribute}_toggle_text"
+            toggle_key = f"{key_prefix}_toggle"
+            toggle_text_key = f"{key_prefix}_toggle_text"
             # Set toggle checked state
-            if (
-                entry_key in self.toggle_states
-                and question_key in self.toggle_states[entry_key]
-            ):
-                enabled = self.toggle_states[entry_key][question_key].get(
-                    attribute, False
-                )
-                if toggle_key in self.toggle_buttons:
-                    self.toggle_buttons[toggle_key].blockSignals(True)
+            enabled = question_toggles.get(attribute, False)
+            if toggle_key in self.toggle_buttons:
+                with QSignalBlocker(self.toggle_buttons[toggle_key]):
                     self.toggle_buttons[toggle_key].setChecked(enabled)
-                    self.toggle_buttons[toggle_key].blockSignals(False)
-                # Restore text
-                if toggle_text_key in self.toggle_line_edits:
-                    text_input = self.toggle_line_edits[toggle_text_key]
-                    existing_text = (
-                        self.toggle_texts.get(entry_key, {})
-                        .get(question_key, {})
-                        .get(attribute, "")
-                    )
-                    if existing_text:
+            # Restore text
+            if toggle_text_key in self.toggle_line_edits:
+                text_input = self.toggle_line_edits[toggle_text_key]
+                existing_text = question_toggle_texts.get(attribute, "")
+                if existing_text:
+                    with QSignalBlocker(text_input):
                         text_input.setText(existing_text)
-                        text_input.setEnabled(enabled)
-                        if enabled:
-                            text_input.setStyleSheet(
-                                "QLineEdit { background-color: white; border: 1px solid #4CAF50; border-radius: 3px; padding: 5px; color: #333333; }"
-                            )
-                        else:
-                            text_input.setStyleSheet(
-                                "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
-                            )
+                    text_input.setEnabled(enabled)
+                    if enabled:
+                        text_input.setStyleSheet(_QSS_LINE_EDIT_ENABLED)
+                    else:
+                        text_input.setStyleSheet(_QSS_LINE_EDIT_DISABLED)
 
             # Restore mandatory text if present
-            mandatory_text_key = f"{entry_key}_{question_key}_{attribute}_mandatory"
+            mandatory_text_key = f"{key_prefix}_mandatory"
             if mandatory_text_key in self.mandatory_text_inputs:
-                existing_text = (
-                    self.mandatory_texts.get(entry_key, {})
-                    .get(question_key, {})
-                    .get(attribute, "")
-                )
+                existing_text = question_mandatory_texts.get(attribute, "")
                 if existing_text:
-                    self.mandatory_text_inputs[mandatory_text_key].setText(
-                        existing_text
-                    )
+                    mandatory_text_input = self.mandatory_text_inputs[
+                        mandatory_text_key
+                    ]
+                    with QSignalBlocker(mandatory_text_input):
+                        mandatory_text_input.setText(existing_text)
 
     def _create_checkboxes(
         self,
@@ -1332,21 +1607,18 @@ class DataExtractionGUI(QMainWindow):
         for option in options:
             checkbox_key = f"{entry_key}_{question_key}_{attribute}_{option}"
             checkbox = QCheckBox(option)
-            checkbox.setStyleSheet("QCheckBox { color: #333333; font-size: 10pt; }")
-            checkbox.stateChanged.connect(
-                lambda state, e=entry_key, q=question_key, a=attribute, o=option: self.on_checkbox_changed(
-                    e, q, a, o, state
-                )
-            )
+            checkbox.setProperty("qssClass", "option")
+            checkbox.setProperty("ctx", (entry_key, question_key, attribute, option))
+            checkbox.stateChanged.connect(self._on_checkbox_signal)
             self.checkboxes[checkbox_key] = checkbox
             checkbox_layout.addWidget(checkbox)
 
         layout.addLayout(checkbox_layout)
         layout.addSpacing(5)
 
-        # Add text field for "Discussion needed" option if present
-        if "Discussion needed" in options:
-            self._add_discussion_field(layout, entry_key, question_key, attribute)
+        # Add text field for "Discussion needed" option, which _parse_attribute_spec
+        # adds to the options of every attribute
+        self._add_discussion_field(layout, entry_key, question_key, attribute)
 
     def _create_multiple_selection_widget(
         self,
@@ -1380,10 +1652,7 @@ class DataExtractionGUI(QMainWindow):
         # Dropdown for selecting options
         combo_key = f"{entry_key}_{question_key}_{attribute}_multiple"
         combo = NoScrollComboBox()
-        combo.setStyleSheet(
-            "QComboBox { background-color: white; color: #333333; border: 1px solid #cccccc; border-radius: 3px; padding: 5px; min-height: 25px; font-size: 10pt; }"
-            "QComboBox::drop-down { border: none; }"
-        )
+        combo.setProperty("qssClass", "options")
         combo.addItem("-- Select an option --")
         combo.addItems(options)
         self.comboboxes[combo_key] = combo
@@ -1392,16 +1661,9 @@ class DataExtractionGUI(QMainWindow):
         # Add button
         add_btn = QPushButton("+")
         add_btn.setMaximumWidth(40)
-        add_btn.setStyleSheet(
-            "QPushButton { background-color: #4CAF50; color: white; font-weight: bold; border: none; border-radius: 3px; padding: 5px; font-size: 12pt; }"
-            "QPushButton:hover { background-color: #45a049; }"
-            "QPushButton:pressed { background-color: #3d8b40; }"
-        )
-        add_btn.clicked.connect(
-            lambda checked=False, e=entry_key, q=question_key, a=attribute: self.on_multiple_add_value(
-                e, q, a
-            )
-        )
+        add_btn.setProperty("qssClass", "add")
+        add_btn.setProperty("ctx", (entry_key, question_key, attribute))
+        add_btn.clicked.connect(self._on_add_value_signal)
         input_layout.addWidget(add_btn)
 
         container_layout.addLayout(input_layout)
@@ -1409,17 +1671,15 @@ class DataExtractionGUI(QMainWindow):
 
         # Container for selected values
         selected_container = QWidget()
-        selected_container.setStyleSheet(
-            "QWidget { background-color: #f9f9f9; border: 1px solid #e0e0e0; border-radius: 3px; padding: 8px; }"
-        )
+        selected_container.setStyleSheet(_QSS_SELECTED_VALUES)
         selected_layout = QVBoxLayout()
         selected_layout.setContentsMargins(5, 5, 5, 5)
         selected_layout.setSpacing(5)
 
         # Store reference to the selected layout for dynamic updates
-        selected_values_key = f"{entry_key}_{question_key}_{attribute}_selected_layout"
-        self._selected_values_layouts = getattr(self, "_selected_values_layouts", {})
-        self._selected_values_layouts[selected_values_key] = selected_layout
+        self._selected_values_layouts[(entry_key, question_key, attribute)] = (
+            selected_layout
+        )
 
         selected_container.setLayout(selected_layout)
         container_layout.addWidget(selected_container)
@@ -1428,9 +1688,9 @@ class DataExtractionGUI(QMainWindow):
         layout.addWidget(container)
         layout.addSpacing(5)
 
-        # Add text field for "Discussion needed" option if present
-        if "Discussion needed" in options:
-            self._add_discussion_field(layout, entry_key, question_key, attribute)
+        # Add text field for "Discussion needed" option, which _parse_attribute_spec
+        # adds to the options of every attribute
+        self._add_discussion_field(layout, entry_key, question_key, attribute)
 
     def on_multiple_add_value(
         self, entry_key: str, question_key: str, attribute: str
@@ -1457,15 +1717,12 @@ class DataExtractionGUI(QMainWindow):
             return
 
         # Add to selected values
-        if entry_key not in self.selected_values:
-            self.selected_values[entry_key] = {}
-        if question_key not in self.selected_values[entry_key]:
-            self.selected_values[entry_key][question_key] = {}
-        if attribute not in self.selected_values[entry_key][question_key]:
-            self.selected_values[entry_key][question_key][attribute] = []
+        attr_selections = self.selected_values[entry_key][question_key].setdefault(
+            attribute, []
+        )
 
         # Check if already selected
-        if selected_text in self.selected_values[entry_key][question_key][attribute]:
+        if selected_text in attr_selections:
             QMessageBox.information(
                 None,
                 "Already Selected",
@@ -1474,7 +1731,7 @@ class DataExtractionGUI(QMainWindow):
             return
 
         # Add the value
-        self.selected_values[entry_key][question_key][attribute].append(selected_text)
+        attr_selections.append(selected_text)
 
         # Enable discussion input if "Discussion needed" was selected
         if selected_text == "Discussion needed":
@@ -1482,8 +1739,8 @@ class DataExtractionGUI(QMainWindow):
                 entry_key, question_key, attribute, True, clear_text=False
             )
 
-        # Update the UI to show selected values
-        self._update_multiple_selection_display(entry_key, question_key, attribute)
+        # Show the new value in the list of selected values
+        self._add_selected_value_row(entry_key, question_key, attribute, selected_text)
 
         # Reset dropdown
         combo.setCurrentIndex(0)
@@ -1491,91 +1748,151 @@ class DataExtractionGUI(QMainWindow):
     def _update_multiple_selection_display(
         self, entry_key: str, question_key: str, attribute: str
     ) -> None:
-        """Update the display of selected values for a multiple selection widget.
+        """Rebuild the display of selected values for a multiple selection widget.
 
         Args:
             entry_key (str): The BIB entry key for the paper.
             question_key (str): The research question identifier.
             attribute (str): The attribute name.
         """
-        selected_values_key = f"{entry_key}_{question_key}_{attribute}_selected_layout"
-        self._selected_values_layouts = getattr(self, "_selected_values_layouts", {})
-
-        if selected_values_key not in self._selected_values_layouts:
+        widget_key = (entry_key, question_key, attribute)
+        selected_layout = self._selected_values_layouts.get(widget_key)
+        if selected_layout is None:
             return
 
-        selected_layout = self._selected_values_layouts[selected_values_key]
+        # Suspend repaints of the list until all rows are replaced
+        selected_container = selected_layout.parentWidget()
+        selected_container.setUpdatesEnabled(False)
 
         # Clear existing items from layout - properly handle nested layouts
-        while selected_layout.count() > 0:
-            item = selected_layout.takeAt(0)
-            if item is not None:
-                if item.widget():
-                    item.widget().deleteLater()
-                elif item.layout():
-                    # Clear any nested layouts
-                    self._clear_layout(item.layout())
+        self._clear_layout(selected_layout)
 
         # Get current selections
-        selections = (
-            self.selected_values.get(entry_key, {})
-            .get(question_key, {})
-            .get(attribute, [])
-        )
+        selections = self.selected_values[entry_key][question_key][attribute]
 
+        rows = self._selected_value_rows[widget_key] = {}
         if not selections:
             empty_label = QLabel("No values selected yet")
-            empty_label.setStyleSheet("color: #999999; font-style: italic;")
+            empty_label.setStyleSheet(_QSS_NO_VALUES_LABEL)
             selected_layout.addWidget(empty_label)
         else:
+            add_layout = selected_layout.addLayout
             for value in selections:
-                # Create a row for each selected value with a delete button
-                value_layout = QHBoxLayout()
-                value_layout.setContentsMargins(0, 0, 0, 0)
-                value_layout.setSpacing(10)
-
-                # Value label
-                value_label = QLabel(value)
-                value_label.setStyleSheet("color: #1a1a1a; font-weight: 500;")
-                value_layout.addWidget(value_label)
-
-                # Delete button - use partial function to properly capture value
-                delete_btn = QPushButton("✕")
-                delete_btn.setMaximumWidth(30)
-                delete_btn.setStyleSheet(
-                    "QPushButton { background-color: #f44336; color: white; font-weight: bold; border: none; border-radius: 3px; padding: 3px; font-size: 11pt; }"
-                    "QPushButton:hover { background-color: #da190b; }"
-                    "QPushButton:pressed { background-color: #ba0000; }"
+                rows[value] = self._create_selected_value_row(
+                    entry_key, question_key, attribute, value
                 )
-                delete_btn.clicked.connect(
-                    partial(
-                        self.on_multiple_remove_value,
-                        entry_key,
-                        question_key,
-                        attribute,
-                        value,
-                    )
-                )
-                value_layout.addWidget(delete_btn)
+                add_layout(rows[value])
 
-                value_layout.addStretch()
+        selected_layout.addStretch()
+        selected_container.setUpdatesEnabled(True)
 
-                # Add to main layout
-                selected_layout.addLayout(value_layout)
+    def _create_selected_value_row(
+        self, entry_key: str, question_key: str, attribute: str, value: str
+    ) -> QHBoxLayout:
+        """Create the row showing one selected value with its delete button.
 
-        selected_layout.addStretch()
+        Args:
+            entry_key (str): The BIB entry key for the paper.
+            question_key (str): The research question identifier.
+            attribute (str): The attribute name.
+            value (str): The selected value.
+
+        Returns:
+            QHBoxLayout: The row layout.
+        """
+        value_layout = QHBoxLayout()
+        value_layout.setContentsMargins(0, 0, 0, 0)
+        value_layout.setSpacing(10)
+
+        # Value label
+        value_label = QLabel(value)
+        value_label.setStyleSheet(_QSS_VALUE_LABEL)
+        value_layout.addWidget(value_label)
+
+        # Delete button
+        delete_btn = QPushButton("✕")
+        delete_btn.setMaximumWidth(30)
+        delete_btn.setStyleSheet(_QSS_DELETE_BUTTON)
+        delete_btn.setProperty("ctx", (entry_key, question_key, attribute, value))
+        delete_btn.clicked.connect(self._on_remove_value_signal)
+        value_layout.addWidget(delete_btn)
+
+        value_layout.addStretch()
+        return value_layout
+
+    def _add_selected_value_row(
+        self, entry_key: str, question_key: str, attribute: str, value: str
+    ) -> None:
+        """Append the row of a newly selected value to a multiple selection widget.
+
+        Only the new row is created; the whole list is rebuilt if it showed the
+        "No values selected yet" placeholder until now.
+
+        Args:
+            entry_key (str): The BIB entry key for the paper.
+            question_key (str): The research question identifier.
+            attribute (str): The attribute name.
+            value (str): The value that was added.
+        """
+        widget_key = (entry_key, question_key, attribute)
+        selected_layout = self._selected_values_layouts.get(widget_key)
+        rows = self._selected_value_rows.get(widget_key)
+        if selected_layout is None or not rows:
+            self._update_multiple_selection_display(entry_key, question_key, attribute)
+            return
+
+        rows[value] = self._create_selected_value_row(
+            entry_key, question_key, attribute, value
+        )
+        # Insert in front of the trailing stretch
+        selected_layout.insertLayout(selected_layout.count() - 1, rows[value])
+
+    def _remove_selected_value_row(
+        self, entry_key: str, question_key: str, attribute: str, value: str
+    ) -> None:
+        """Remove the row of a deselected value from a multiple selection widget.
+
+        Only that row is removed; the whole list is rebuilt if no value is left, so
+        that the "No values selected yet" placeholder is shown.
+
+        Args:
+            entry_key (str): The BIB entry key for the paper.
+            question_key (str): The research question identifier.
+            attribute (str): The attribute name.
+            value (str): The value that was removed.
+        """
+        widget_key = (entry_key, question_key, attribute)
+        selected_layout = self._selected_values_layouts.get(widget_key)
+        rows = self._selected_value_rows.get(widget_key, {})
+        if (
+            selected_layout is None
+            or value not in rows
+            or not self.selected_values[entry_key][question_key][attribute]
+        ):
+            self._update_multiple_selection_display(entry_key, question_key, attribute)
+            return
+
+        row = rows.pop(value)
+        selected_layout.removeItem(row)
+        self._clear_layout(row)
+        row.deleteLater()
 
     def _clear_layout(self, layout) -> None:
         """Recursively clear all widgets and nested layouts.
 
+        Items are taken from the end so that the remaining ones are not shifted.
+
         Args:
             layout: The layout to clear.
         """
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
+        for index in range(layout.count() - 1, -1, -1):
+            item = layout.takeAt(index)
+            widget = item.widget()
+            if widget is not None:
+                # Detach right away; the widget is only deleted on the next event loop pass
+                widget.setParent(None)
+                widget.deleteLater()
+            elif item.layout() is not None:
                 self._clear_layout(item.layout())
 
     def on_multiple_remove_value(
@@ -1589,21 +1906,17 @@ class DataExtractionGUI(QMainWindow):
             attribute (str): The attribute name.
             value (str): The value to remove.
         """
-        if (
-            entry_key in self.selected_values
-            and question_key in self.selected_values[entry_key]
-            and attribute in self.selected_values[entry_key][question_key]
-            and value in self.selected_values[entry_key][question_key][attribute]
-        ):
-
+        try:
             self.selected_values[entry_key][question_key][attribute].remove(value)
+        except (KeyError, ValueError):
+            return
 
-            if value == "Discussion needed":
-                self._set_discussion_field_state(
-                    entry_key, question_key, attribute, False, clear_text=True
-                )
+        if value == "Discussion needed":
+            self._set_discussion_field_state(
+                entry_key, question_key, attribute, False, clear_text=True
+            )
 
-            self._update_multiple_selection_display(entry_key, question_key, attribute)
+        self._remove_selected_value_row(entry_key, question_key, attribute, value)
 
     def _create_radio_buttons(
         self,
@@ -1631,12 +1944,9 @@ class DataExtractionGUI(QMainWindow):
         for idx, option in enumerate(options):
             radio_key = f"{entry_key}_{question_key}_{attribute}_{option}"
             radio = QRadioButton(option)
-            radio.setStyleSheet("QRadioButton { color: #333333; font-size: 10pt; }")
-            radio.toggled.connect(
-                lambda checked, e=entry_key, q=question_key, a=attribute, o=option: self.on_radio_button_changed(
-                    e, q, a, o, checked
-                )
-            )
+            radio.setProperty("qssClass", "option")
+            radio.setProperty("ctx", (entry_key, question_key, attribute, option))
+            radio.toggled.connect(self._on_radio_signal)
             self.radio_buttons[radio_key] = radio
             group.addButton(radio, idx)
             radio_layout.addWidget(radio)
@@ -1644,9 +1954,9 @@ class DataExtractionGUI(QMainWindow):
         layout.addLayout(radio_layout)
         layout.addSpacing(5)
 
-        # Add text field for "Discussion needed" option if present
-        if "Discussion needed" in options:
-            self._add_discussion_field(layout, entry_key, question_key, attribute)
+        # Add text field for "Discussion needed" option, which _parse_attribute_spec
+        # adds to the options of every attribute
+        self._add_discussion_field(layout, entry_key, question_key, attribute)
 
     def _create_dropdown_widget(
         self,
@@ -1667,24 +1977,18 @@ class DataExtractionGUI(QMainWindow):
         """
         combo_key = f"{entry_key}_{question_key}_{attribute}"
         combo = NoScrollComboBox()
-        combo.setStyleSheet(
-            "QComboBox { background-color: white; color: #333333; border: 1px solid #cccccc; border-radius: 3px; padding: 5px; min-height: 25px; font-size: 10pt; }"
-            "QComboBox::drop-down { border: none; }"
-        )
+        combo.setProperty("qssClass", "options")
         combo.addItem("-- Select an option --")
         combo.addItems(options)
-        combo.currentTextChanged.connect(
-            lambda text, e=entry_key, q=question_key, a=attribute: self.on_dropdown_changed(
-                e, q, a, text
-            )
-        )
+        combo.setProperty("ctx", (entry_key, question_key, attribute))
+        combo.currentTextChanged.connect(self._on_dropdown_signal)
         self.comboboxes[combo_key] = combo
         layout.addWidget(combo)
         layout.addSpacing(5)
 
-        # Add text field for "Discussion needed" option
-        if "Discussion needed" in options:
-            self._add_discussion_field(layout, entry_key, question_key, attribute)
+        # Add text field for "Discussion needed" option, which _parse_attribute_spec
+        # adds to the options of every attribute
+        self._add_discussion_field(layout, entry_key, question_key, attribute)
 
     def _add_discussion_field(
         self, layout: QVBoxLayout, entry_key: str, question_key: str, attribute: str
@@ -1699,18 +2003,13 @@ class DataExtractionGUI(QMainWindow):
         """
         # Create a container frame for discussion field
         discussion_frame = QFrame()
-        discussion_frame.setStyleSheet(
-            "QFrame { background-color: #e8e8e8; border: 2px solid #999999; border-radius: 5px; padding: 10px; }"
-        )
+        discussion_frame.setStyleSheet(_QSS_DISCUSSION_FRAME)
         discussion_layout = QVBoxLayout()
 
         # Label with enhanced styling
         discussion_label = QLabel("📝 Discussion needed - please describe:")
-        label_font = QFont()
-        label_font.setBold(True)
-        label_font.setPointSize(9)
-        discussion_label.setFont(label_font)
-        discussion_label.setStyleSheet("color: #555555;")
+        discussion_label.setFont(_font(9, bold=True))
+        discussion_label.setStyleSheet(_QSS_DISCUSSION_LABEL)
         discussion_layout.addWidget(discussion_label)
 
         # Text input with enhanced styling
@@ -1719,14 +2018,11 @@ class DataExtractionGUI(QMainWindow):
         discussion_input.setEnabled(False)
         discussion_input.setMinimumHeight(35)  # Make it taller
         discussion_input.setPlaceholderText("Enter detailed discussion notes here...")
-        discussion_input.setStyleSheet(
-            "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; font-size: 10pt; color: #999999; }"
-        )
-        discussion_input.textChanged.connect(
-            lambda text, e=entry_key, q=question_key, a=attribute, k=discussion_key: self.on_discussion_text_changed(
-                e, q, a, k, text
-            )
+        discussion_input.setStyleSheet(_QSS_DISCUSSION_INACTIVE)
+        discussion_input.setProperty(
+            "ctx", (entry_key, question_key, attribute, discussion_key)
         )
+        discussion_input.textChanged.connect(self._on_discussion_text_signal)
         self.discussion_text_inputs[discussion_key] = discussion_input
         self.discussion_containers[discussion_key] = discussion_frame
         discussion_layout.addWidget(discussion_input)
@@ -1748,27 +2044,94 @@ class DataExtractionGUI(QMainWindow):
         """Show/hide and enable/disable the discussion UI for one attribute."""
         discussion_key = f"{entry_key}_{question_key}_{attribute}_discussion"
 
-        if discussion_key in self.discussion_containers:
-            self.discussion_containers[discussion_key].setVisible(visible)
+        # Skip if the field is already shown, or already hidden with its text cleared
+        if self._discussion_state.get(discussion_key) == visible:
+            return
+        if visible or clear_text:
+            self._discussion_state[discussion_key] = visible
+        else:
+            self._discussion_state.pop(discussion_key, None)
+
+        discussion_container = self.discussion_containers.get(discussion_key)
+        if discussion_container is not None:
+            discussion_container.setVisible(visible)
 
-        if discussion_key not in self.discussion_text_inputs:
+        discussion_input = self.discussion_text_inputs.get(discussion_key)
+        if discussion_input is None:
             return
 
-        discussion_input = self.discussion_text_inputs[discussion_key]
         discussion_input.setEnabled(visible)
 
         if visible:
-            discussion_input.setStyleSheet(
-                "QLineEdit { background-color: white; border: 1px solid #ff9800; border-radius: 3px; padding: 5px; font-size: 10pt; color: #333333; }"
-            )
+            discussion_input.setStyleSheet(_QSS_DISCUSSION_ACTIVE)
         else:
-            discussion_input.setStyleSheet(
-                "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; font-size: 10pt; color: #999999; }"
-            )
+            discussion_input.setStyleSheet(_QSS_DISCUSSION_INACTIVE)
             if clear_text:
                 discussion_input.clear()
                 self.discussion_texts[discussion_key] = ""
 
+    def _set_Other_field_state(
+        self, entry_key: str, question_key: str, attribute: str, enabled: bool
+    ) -> None:
+        """Enable or disable (and clear) the "Other" text input of one attribute."""
+        text_input = self.text_inputs.get(
+            f"{entry_key}_{question_key}_{attribute}_Other"
+        )
+        if text_input is None:
+            return
+
+        text_input.setEnabled(enabled)
+        if enabled:
+            text_input.setStyleSheet(_QSS_LINE_EDIT_ENABLED)
+        else:
+            text_input.setStyleSheet(_QSS_LINE_EDIT_DISABLED)
+            text_input.clear()
+            self.selected_Other_text[entry_key][question_key][attribute] = ""
+
+    # The slots below are shared by all widgets of a kind. Each widget carries its
+    # (entry_key, question_key, attribute[, option]) in its "ctx" property, so no
+    # per-widget closure is needed to route the signal to its handler.
+
+    def _on_checkbox_signal(self, state: int) -> None:
+        """Route a checkbox's stateChanged signal to on_checkbox_changed."""
+        self.on_checkbox_changed(*self.sender().property("ctx"), state)
+
+    def _on_radio_signal(self, checked: bool) -> None:
+        """Route a radio button's toggled signal to on_radio_button_changed."""
+        self.on_radio_button_changed(*self.sender().property("ctx"), checked)
+
+    def _on_dropdown_signal(self, text: str) -> None:
+        """Route a dropdown's currentTextChanged signal to on_dropdown_changed."""
+        self.on_dropdown_changed(*self.sender().property("ctx"), text)
+
+    def _on_discussion_text_signal(self, text: str) -> None:
+        """Route a discussion input's textChanged signal to on_discussion_text_changed."""
+        self.on_discussion_text_changed(*self.sender().property("ctx"), text)
+
+    def _on_add_value_signal(self) -> None:
+        """Route an add button's clicked signal to on_multiple_add_value."""
+        self.on_multiple_add_value(*self.sender().property("ctx"))
+
+    def _on_remove_value_signal(self) -> None:
+        """Route a delete button's clicked signal to on_multiple_remove_value."""
+        self.on_multiple_remove_value(*self.sender().property("ctx"))
+
+    def _on_Other_text_signal(self, text: str) -> None:
+        """Route an "Other" text input's textChanged signal to on_Other_text_changed."""
+        self.on_Other_text_changed(*self.sender().property("ctx"), text)
+
+    def _on_toggle_signal(self, state: int) -> None:
+        """Route a toggle button's stateChanged signal to on_toggle_changed."""
+        self.on_toggle_changed(*self.sender().property("ctx"), state)
+
+    def _on_toggle_text_signal(self, text: str) -> None:
+        """Route a toggle text input's textChanged signal to on_toggle_text_changed."""
+        self.on_toggle_text_changed(*self.sender().property("ctx"), text)
+
+    def _on_mandatory_text_signal(self, text: str) -> None:
+        """Route a mandatory text input's textChanged signal to on_mandatory_text_changed."""
+        self.on_mandatory_text_changed(*self.sender().property("ctx"), text)
+
     def on_checkbox_changed(
         self, entry_key: str, question_key: str, attribute: str, option: str, state: int
     ) -> None:
@@ -1781,30 +2144,20 @@ class DataExtractionGUI(QMainWindow):
             option (str): The option name.
             state (int): The new state of the checkbox (CheckState).
         """
-        # Update selected values (state 2 = checked, 0 = unchecked)
+        # Nothing to do if the stored selection already matches (state 2 = checked, 0 = unchecked)
+        selections = self.selected_values[entry_key][question_key][attribute]
+        if (state == 2) == (option in selections):
+            return
+
+        # Update selected values
         if state == 2:
-            if option not in self.selected_values[entry_key][question_key][attribute]:
-                self.selected_values[entry_key][question_key][attribute].append(option)
+            selections.append(option)
         else:
-            if option in self.selected_values[entry_key][question_key][attribute]:
-                self.selected_values[entry_key][question_key][attribute].remove(option)
+            selections.remove(option)
 
         # Enable/disable text input for "Other" option
         if option == "Other":
-            text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
-            if text_input_key in self.text_inputs:
-                if state == 2:  # checked
-                    self.text_inputs[text_input_key].setEnabled(True)
-                    self.text_inputs[text_input_key].setStyleSheet(
-                        "QLineEdit { background-color: white; border: 1px solid #4CAF50; border-radius: 3px; padding: 5px; color: #333333; }"
-                    )
-                else:
-                    self.text_inputs[text_input_key].setEnabled(False)
-                    self.text_inputs[text_input_key].setStyleSheet(
-                        "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
-                    )
-                    self.text_inputs[text_input_key].clear()
-                    self.selected_Other_text[entry_key][question_key][attribute] = ""
+            self._set_Other_field_state(entry_key, question_key, attribute, state == 2)
 
         # Enable/disable text input for "Discussion needed" option
         if option == "Discussion needed":
@@ -1833,36 +2186,25 @@ class DataExtractionGUI(QMainWindow):
             option (str): The option name.
             checked (bool): Whether the radio button is checked.
         """
-        if checked:
+        question_values = self.selected_values[entry_key][question_key]
+        # Nothing to do if this option is already the stored selection
+        if checked and question_values[attribute] != [option]:
             # For single-choice, replace the entire selection list with just this option
-            self.selected_values[entry_key][question_key][attribute] = [option]
+            question_values[attribute] = [option]
 
             # Enable/disable text input for "Other" option
-            text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
-            if text_input_key in self.text_inputs:
-                if option == "Other":
-                    self.text_inputs[text_input_key].setEnabled(True)
-                    self.text_inputs[text_input_key].setStyleSheet(
-                        "QLineEdit { background-color: white; border: 1px solid #4CAF50; border-radius: 3px; padding: 5px; color: #333333; }"
-                    )
-                else:
-                    self.text_inputs[text_input_key].setEnabled(False)
-                    self.text_inputs[text_input_key].setStyleSheet(
-                        "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
-                    )
-                    self.text_inputs[text_input_key].clear()
-                    self.selected_Other_text[entry_key][question_key][attribute] = ""
+            self._set_Other_field_state(
+                entry_key, question_key, attribute, option == "Other"
+            )
 
             # Enable/disable discussion text field if this is "Discussion needed"
-            discussion_key = f"{entry_key}_{question_key}_{attribute}_discussion"
-            if discussion_key in self.discussion_text_inputs:
-                self._set_discussion_field_state(
-                    entry_key,
-                    question_key,
-                    attribute,
-                    option == "Discussion needed",
-                    clear_text=option != "Discussion needed",
-                )
+            self._set_discussion_field_state(
+                entry_key,
+                question_key,
+                attribute,
+                option == "Discussion needed",
+                clear_text=option != "Discussion needed",
+            )
 
     def on_dropdown_changed(
         self, entry_key: str, question_key: str, attribute: str, text: str
@@ -1880,48 +2222,29 @@ class DataExtractionGUI(QMainWindow):
             self.selected_values[entry_key][question_key][attribute] = [text]
 
             # Enable/disable text input for "Other" option
-            text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
-            if text_input_key in self.text_inputs:
-                if text == "Other":
-                    self.text_inputs[text_input_key].setEnabled(True)
-                    self.text_inputs[text_input_key].setStyleSheet(
-                        "QLineEdit { background-color: white; border: 1px solid #4CAF50; border-radius: 3px; padding: 5px; color: #333333; }"
-                    )
-                else:
-                    self.text_inputs[text_input_key].setEnabled(False)
-                    self.text_inputs[text_input_key].setStyleSheet(
-                        "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
-                    )
-                    self.text_inputs[text_input_key].clear()
-                    self.selected_Other_text[entry_key][question_key][attribute] = ""
+            self._set_Other_field_state(
+                entry_key, question_key, attribute, text == "Other"
+            )
 
             # Enable/disable discussion text field if this is "Discussion needed"
-            discussion_key = f"{entry_key}_{question_key}_{attribute}_discussion"
-            if discussion_key in self.discussion_text_inputs:
-                self._set_discussion_field_state(
-                    entry_key,
-                    question_key,
-                    attribute,
-                    text == "Discussion needed",
-                    clear_text=text != "Discussion needed",
-                )
+            self._set_discussion_field_state(
+                entry_key,
+                question_key,
+                attribute,
+                text == "Discussion needed",
+                clear_text=text != "Discussion needed",
+            )
         else:
             # Clear selection if placeholder is selected
             self.selected_values[entry_key][question_key][attribute] = []
 
             # Disable text input for "Other" option
-            text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
-            if text_input_key in self.text_inputs:
-                self.text_inputs[text_input_key].setEnabled(False)
-                self.text_inputs[text_input_key].clear()
-                self.selected_Other_text[entry_key][question_key][attribute] = ""
+            self._set_Other_field_state(entry_key, question_key, attribute, False)
 
             # Disable discussion text field
-            discussion_key = f"{entry_key}_{question_key}_{attribute}_discussion"
-            if discussion_key in self.discussion_text_inputs:
-                self._set_discussion_field_state(
-                    entry_key, question_key, attribute, False, clear_text=True
-                )
+            self._set_discussion_field_state(
+                entry_key, question_key, attribute, False, clear_text=True
+            )
 
     def on_discussion_text_changed(
         self,
@@ -1940,7 +2263,8 @@ class DataExtractionGUI(QMainWindow):
             discussion_key (str): The discussion field key.
             text (str): The new text value.
         """
-        self.discussion_texts[discussion_key] = text
+        # Stored stripped so validation and export can use it as is
+        self.discussion_texts[discussion_key] = text.strip()
 
     def on_Other_text_changed(
         self, entry_key: str, question_key: str, attribute: str, text: str
@@ -1975,51 +2299,30 @@ class DataExtractionGUI(QMainWindow):
             text_input = self.toggle_line_edits[toggle_text_key]
             if is_checked:
                 text_input.setEnabled(True)
-                text_input.setStyleSheet(
-                    "QLineEdit { background-color: white; border: 1px solid #4CAF50; border-radius: 3px; padding: 5px; color: #333333; }"
-                )
+                text_input.setStyleSheet(_QSS_LINE_EDIT_ENABLED)
                 # restore existing text if present
-                existing = (
-                    self.toggle_texts.get(entry_key, {})
-                    .get(question_key, {})
-                    .get(attribute, "")
-                )
+                existing = self.toggle_texts[entry_key][question_key].get(attribute, "")
                 if existing:
-                    text_input.blockSignals(True)
-                    text_input.setText(existing)
-                    text_input.blockSignals(False)
+                    with QSignalBlocker(text_input):
+                        text_input.setText(existing)
             else:
                 text_input.setEnabled(False)
-                text_input.setStyleSheet(
-                    "QLineEdit { background-color: #f5f5f5; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; color: #999999; }"
-                )
+                text_input.setStyleSheet(_QSS_LINE_EDIT_DISABLED)
                 text_input.clear()
                 # clear stored text
-                if (
-                    entry_key in self.toggle_texts
-                    and question_key in self.toggle_texts[entry_key]
-                ):
-                    self.toggle_texts[entry_key][question_key][attribute] = ""
+                self.toggle_texts[entry_key][question_key][attribute] = ""
 
     def on_toggle_text_changed(
         self, entry_key: str, question_key: str, attribute: str, text: str
     ) -> None:
         """Handle changes to the toggle-associated text input."""
-        if entry_key not in self.toggle_texts:
-            self.toggle_texts[entry_key] = {}
-        if question_key not in self.toggle_texts[entry_key]:
-            self.toggle_texts[entry_key][question_key] = {}
-        self.toggle_texts[entry_key][question_key][attribute] = text
+        self.toggle_texts[entry_key][question_key][attribute] = text.strip()
 
     def on_mandatory_text_changed(
         self, entry_key: str, question_key: str, attribute: str, text: str
     ) -> None:
         """Handle changes to mandatory text input."""
-        if entry_key not in self.mandatory_texts:
-            self.mandatory_texts[entry_key] = {}
-        if question_key not in self.mandatory_texts[entry_key]:
-            self.mandatory_texts[entry_key][question_key] = {}
-        self.mandatory_texts[entry_key][question_key][attribute] = text
+        self.mandatory_texts[entry_key][question_key][attribute] = text.strip()
 
     def on_exclude_changed(self, state: int) -> None:
         """Handle the exclude checkbox state change.
@@ -2037,24 +2340,12 @@ class DataExtractionGUI(QMainWindow):
 
         # Show/hide reason text field based on exclusion status
         if self.exclude_reason_input is not None:
-            self.exclude_reason_input.setVisible(is_checked)
-            self.exclude_reason_label.setVisible(is_checked)
-
             if is_checked:
                 # Load previous reason if available
                 previous_reason = self.excluded_reasons.get(entry_key, "")
-                self.exclude_reason_input.blockSignals(True)
-                self.exclude_reason_input.setText(previous_reason)
-                self.exclude_reason_input.blockSignals(False)
-                self.exclude_reason_input.setEnabled(True)
-                self.exclude_reason_input.setStyleSheet(
-                    "QLineEdit { background-color: white; color: #333333; border: 1px solid #d9534f; border-radius: 3px; padding: 5px; margin-left: 20px; }"
-                )
-            else:
-                self.exclude_reason_input.setEnabled(False)
-                self.exclude_reason_input.setStyleSheet(
-                    "QLineEdit { background-color: #f9f9f9; color: #999999; border: 1px solid #d0d0d0; border-radius: 3px; padding: 5px; margin-left: 20px; }"
-                )
+                with QSignalBlocker(self.exclude_reason_input):
+                    self.exclude_reason_input.setText(previous_reason)
+            self._apply_exclude_reason_state(is_checked)
 
         # Show message if excluding
         if is_checked:
@@ -2064,6 +2355,29 @@ class DataExtractionGUI(QMainWindow):
                 "This paper will be marked as excluded from the full text review. Please provide a reason for exclusion in the text field below. You can click 'Finish' to proceed to the next paper.",
             )
 
+    def _apply_exclude_reason_state(self, is_excluded: bool) -> None:
+        """Show, enable and style the exclusion reason field for an exclusion state.
+
+        Skips the update when the field already reflects the given state, so
+        consecutive papers with the same exclusion state do not restyle it.
+
+        Args:
+            is_excluded (bool): Whether the current paper is excluded.
+        """
+        if (
+            self.exclude_reason_input is None
+            or is_excluded == self._last_excluded_style
+        ):
+            return
+        self._last_excluded_style = is_excluded
+
+        self.exclude_reason_input.setVisible(is_excluded)
+        self.exclude_reason_label.setVisible(is_excluded)
+        self.exclude_reason_input.setEnabled(is_excluded)
+        self.exclude_reason_input.setStyleSheet(
+            _QSS_EXCLUDE_REASON_ACTIVE if is_excluded else _QSS_EXCLUDE_REASON_INACTIVE
+        )
+
     def on_exclude_reason_changed(self, text: str) -> None:
         """Handle changes to the exclusion reason text field.
 
@@ -2079,184 +2393,247 @@ class DataExtractionGUI(QMainWindow):
         if show_box:
             QMessageBox.information(self, "Success", "Data exported to export.json")
 
-    def _perform_export(self) -> bool:
-        """Perform the actual export to JSON file without showing messages.
+    def _build_export_entry(self, entry_key: str) -> dict:
+        """Build the export entry of a paper from its in-memory state.
 
-        Preserves data from previously exported papers that aren't currently loaded in memory,
-        and updates papers that have been re-edited.
+        Args:
+            entry_key (str): The BIB entry key for the paper.
 
         Returns:
-            bool: True if export was successful, False Otherwise.
+            dict: The paper's entry as written to export.json.
         """
-        try:
-            output = {}
-
-            # First, load existing export data to preserve papers not in current session
-            export_file = "export.json"
-            if os.path.exists(export_file):
-                try:
-                    with open(export_file, "r") as f:
-                        existing_export = json.load(f)
-                        output.update(existing_export)
-                except (json.JSONDecodeError, IOError):
-                    pass  # If we can't read, just start fresh
-
-            # Now update/add papers from current session (this handles re-edited papers)
-            for entry_key in self.selected_values:
-                entry_data = self.papers.get(entry_key, {})
-                output[entry_key] = {
-                    "paper": {
-                        "title": entry_data.get("title", "Unknown"),
-                        "authors": entry_data.get("authors", "Unknown"),
-                        "year": entry_data.get("year", "Unknown"),
-                    },
-                    "excluded_from_full_text_review": self.excluded_papers.get(
-                        entry_key, False
-                    ),
-                    "exclusion_reason": self.excluded_reasons.get(entry_key, ""),
-                    "responses": {},
-                }
+        entry_data = self.papers.get(entry_key, {})
+        paper_out = {
+            "paper": {
+                "title": entry_data.get("title", "Unknown"),
+                "authors": entry_data.get("authors", "Unknown"),
+                "year": entry_data.get("year", "Unknown"),
+            },
+            "excluded_from_full_text_review": self.excluded_papers.get(
+                entry_key, False
+            ),
+            "exclusion_reason": self.excluded_reasons.get(entry_key, ""),
+            "responses": {},
+        }
+
+        responses = paper_out["responses"]
+        paper_Other_texts = self.selected_Other_text[entry_key]
+        for question_key, question_values in self.selected_values[entry_key].items():
+            question_Other_texts = paper_Other_texts[question_key]
+            # Attributes without a selection are left out of the export
+            question_out = {
+                attribute: self._export_selections(
+                    entry_key,
+                    question_key,
+                    attribute,
+                    selections,
+                    question_Other_texts.get(attribute, ""),
+                )
+                for attribute, selections in question_values.items()
+                if selections
+            }
+            if question_out:
+                responses[question_key] = question_out
+
+        # Export toggle states (only include toggles that are enabled)
+        toggle_out = {}
+        paper_toggle_texts = self.toggle_texts.get(entry_key, {})
+        for qk, attrs in self.toggle_states.get(entry_key, {}).items():
+            question_toggle_texts = paper_toggle_texts.get(qk, {})
+            question_out = {
+                attr: {"enabled": True, "text": question_toggle_texts.get(attr, "")}
+                for attr, enabled in attrs.items()
+                if enabled
+            }
+            if question_out:
+                toggle_out[qk] = question_out
 
-                for question_key in self.selected_values[entry_key]:
-                    output[entry_key]["responses"][question_key] = {}
-                    for attribute in self.selected_values[entry_key][question_key]:
-                        selections = self.selected_values[entry_key][question_key][
-                            attribute
-                        ].copy()
-
-                        # Handle "Other" option
-                        if (
-                            "Other" in selections
-                            and self.selected_Other_text[entry_key][question_key][
-                                attribute
-                            ]
-                        ):
-                            selections.remove("Other")
-                            selections.append(
-                                f"Other: {self.selected_Other_text[entry_key][question_key][attribute]}"
-                            )
+        if toggle_out:
+            paper_out["toggle_states"] = toggle_out
 
-                        # Handle "Discussion needed" option
-                        if "Discussion needed" in selections:
-                            discussion_key = (
-                                f"{entry_key}_{question_key}_{attribute}_discussion"
-                            )
-                            discussion_text = self.discussion_texts.get(discussion_key)
-                            if (
-                                discussion_text is None or discussion_text == ""
-                            ) and discussion_key in self.discussion_text_inputs:
-                                discussion_text = self.discussion_text_inputs[
-                                    discussion_key
-                                ].text()
-                            if discussion_text:
-                                selections.remove("Discussion needed")
-                                selections.append(
-                                    f"Discussion needed: {discussion_text}"
-                                )
-
-                        output[entry_key]["responses"][question_key][
-                            attribute
-                        ] = selections
-
-                # Export toggle states (only include toggles that are enabled)
-                toggle_out = {}
-                if entry_key in self.toggle_states:
-                    for qk, attrs in self.toggle_states[entry_key].items():
-                        for attr, enabled in attrs.items():
-                            if enabled:
-                                if qk not in toggle_out:
-                                    toggle_out[qk] = {}
-                                text = (
-                                    self.toggle_texts.get(entry_key, {})
-                                    .get(qk, {})
-                                    .get(attr, "")
-                                )
-                                toggle_out[qk][attr] = {"enabled": True, "text": text}
-
-                if toggle_out:
-                    output[entry_key]["toggle_states"] = toggle_out
-
-                # Export mandatory texts (only include non-empty mandatory texts)
-                mandatory_out = {}
-                if entry_key in self.mandatory_texts:
-                    for qk, attrs in self.mandatory_texts[entry_key].items():
-                        for attr, text in attrs.items():
-                            if text.strip():  # Only include if text is provided
-                                if qk not in mandatory_out:
-                                    mandatory_out[qk] = {}
-                                mandatory_out[qk][attr] = text
-
-                if mandatory_out:
-                    output[entry_key]["mandatory_texts"] = mandatory_out
-
-            with open("export.json", "w") as f:
-                json.dump(output, f, indent=2)
+        # Export mandatory texts (only include non-empty mandatory texts)
+        mandatory_out = {}
+        if entry_key in self.mandatory_texts:
+            for qk, attrs in self.mandatory_texts[entry_key].items():
+                for attr, text in attrs.items():
+                    if text:  # Only include if text is provided
+                        if qk not in mandatory_out:
+                            mandatory_out[qk] = {}
+                        mandatory_out[qk][attr] = text
 
-            return True
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error exporting data: {str(e)}")
-            return False
+        if mandatory_out:
+            paper_out["mandatory_texts"] = mandatory_out
 
-    def clear_all(self) -> None:
-        """Clear all selections and reset the interface."""
-        for entry_key in self.selected_values:
-            for question_key in self.selected_values[entry_key]:
-                for attribute in self.selected_values[entry_key][question_key]:
-                    self.selected_values[entry_key][question_key][attribute] = []
-                    self.selected_Other_text[entry_key][question_key][attribute] = ""
+        return paper_out
+
+    def _export_selections(
+        self,
+        entry_key: str,
+        question_key: str,
+        attribute: str,
+        selections: List[str],
+        Other_text: str,
+    ) -> List[str]:
+        """Return the selections of an attribute in the form written to export.json.
+
+        "Other" and "Discussion needed" are replaced by their prefixed free text if
+        one was entered.
+
+        Args:
+            entry_key (str): The BIB entry key for the paper.
+            question_key (str): The research question identifier.
+            attribute (str): The attribute name.
+            selections (List[str]): The selected options.
+            Other_text (str): The text entered for the "Other" option.
+
+        Returns:
+            List[str]: A new list with the exported selections.
+        """
+        # Always a copy: the cached export must not share lists with the live state
+        selections = list(selections)
 
-        for checkbox in self.checkboxes.values():
-            checkbox.setChecked(False)
+        # Both special options are replaced in place, so the selection order is kept
+        if Other_text and "Other" in selections:
+            selections[selections.index("Other")] = f"{_OTHER_PREFIX}{Other_text}"
 
-        for radio in self.radio_buttons.values():
-            radio.setChecked(False)
+        if "Discussion needed" in selections:
+            # discussion_texts is kept up to date on every edit, so the input is not read
+            discussion_text = self.discussion_texts.get(
+                f"{entry_key}_{question_key}_{attribute}_discussion"
+            )
+            if discussion_text:
+                selections[selections.index("Discussion needed")] = (
+                    f"{_DISCUSSION_PREFIX}{discussion_text}"
+                )
 
-        for combo in self.comboboxes.values():
-            combo.setCurrentIndex(0)
+        return selections
 
-        for text_input in self.text_inputs.values():
-            text_input.clear()
-            text_input.setEnabled(False)
+    def _perform_export(self) -> Optional[dict]:
+        """Perform the actual export to JSON file without showing messages.
 
-        for discussion_input in self.discussion_text_inputs.values():
-            discussion_input.clear()
-            discussion_input.setEnabled(False)
+        Preserves data from previously exported papers that aren't currently loaded in memory,
+        and updates papers that have been re-edited. Only papers shown since the last export
+        are rebuilt; the others are taken over from the cached export data. The file is only
+        rewritten if a rebuilt paper differs from what it already contains.
 
-        for discussion_container in self.discussion_containers.values():
-            discussion_container.setVisible(False)
+        Returns:
+            Optional[dict]: The exported data as written to disk, or None if the export failed.
+        """
+        try:
+            # Start from the existing export data to preserve papers not in current session
+            exported_data = self._get_exported_data()
+            output = dict(exported_data)
+
+            # Now update/add papers from current session (this handles re-edited papers).
+            # Without readable export data, every paper in memory has to be written again.
+            entry_keys = self._export_dirty if exported_data else self.selected_values
+            changed = not exported_data
+            for entry_key in entry_keys:
+                paper_out = self._build_export_entry(entry_key)
+                if output.get(entry_key) != paper_out:
+                    output[entry_key] = paper_out
+                    changed = True
+
+            if changed:
+                export_file = "export.json"
+                _dump_json_file(export_file, output)
+
+                # Keep what was just written as the cached parse instead of re-reading it
+                self._export_cache = output
+                self._export_mtime = os.stat(export_file).st_mtime_ns
+
+            # The current paper can still be edited after this export
+            self._export_dirty.clear()
+            if self.paper_keys:
+                self._export_dirty.add(self.paper_keys[self.current_paper_index])
+
+            return output
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error exporting data: {str(e)}")
+            return None
 
+    def clear_all(self) -> None:
+        """Clear all selections and reset the interface."""
+        # Every paper in memory is changed here
+        self._export_dirty.update(self.selected_values)
+
+        # Reset the stored state in place; the per-paper containers are kept so the
+        # defaultdict levels stay intact
+        for paper_values in self.selected_values.values():
+            for question_values in paper_values.values():
+                # Every attribute needs its own list, so no dict.fromkeys here
+                question_values.update({attribute: [] for attribute in question_values})
+        for state, empty in (
+            (self.selected_Other_text, ""),
+            (self.toggle_states, False),
+            (self.toggle_texts, ""),
+            (self.mandatory_texts, ""),
+        ):
+            for paper_state in state.values():
+                for question_state in paper_state.values():
+                    question_state.update(dict.fromkeys(question_state, empty))
         self.discussion_texts.clear()
+        self._discussion_state.clear()
+
+        # The state is already reset, so the widgets are reset with their signals
+        # blocked instead of running every change handler once per widget
+        with contextlib.ExitStack() as blockers:
+            for widget in itertools.chain(
+                self.checkboxes.values(),
+                self.radio_buttons.values(),
+                self.comboboxes.values(),
+                self.text_inputs.values(),
+                self.discussion_text_inputs.values(),
+                self.toggle_buttons.values(),
+                self.toggle_line_edits.values(),
+                self.mandatory_text_inputs.values(),
+            ):
+                blockers.enter_context(QSignalBlocker(widget))
 
-        # Clear toggle buttons and their texts
-        for toggle in self.toggle_buttons.values():
-            toggle.setChecked(False)
+            for checkbox in self.checkboxes.values():
+                checkbox.setChecked(False)
+
+            # An exclusive group does not let its checked button be unchecked
+            for group in self.radio_button_groups.values():
+                group.setExclusive(False)
+                for radio in group.buttons():
+                    radio.setChecked(False)
+                group.setExclusive(True)
+
+            for combo in self.comboboxes.values():
+                combo.setCurrentIndex(0)
+
+            for text_input in self.text_inputs.values():
+                text_input.clear()
+                text_input.setEnabled(False)
+                text_input.setStyleSheet(_QSS_LINE_EDIT_DISABLED)
+
+            for discussion_input in self.discussion_text_inputs.values():
+                discussion_input.clear()
+                discussion_input.setEnabled(False)
+                discussion_input.setStyleSheet(_QSS_DISCUSSION_INACTIVE)
 
-        for t_edit in self.toggle_line_edits.values():
-            t_edit.clear()
-            t_edit.setEnabled(False)
+            for discussion_container in self.discussion_containers.values():
+                discussion_container.setVisible(False)
 
-        # Clear stored toggle state/text structures
-        for entry_key in self.toggle_states:
-            for qk in self.toggle_states[entry_key]:
-                for attr in list(self.toggle_states[entry_key][qk].keys()):
-                    self.toggle_states[entry_key][qk][attr] = False
+            # Clear toggle buttons and their texts
+            for toggle in self.toggle_buttons.values():
+                toggle.setChecked(False)
 
-        for entry_key in self.toggle_texts:
-            for qk in self.toggle_texts[entry_key]:
-                for attr in list(self.toggle_texts[entry_key][qk].keys()):
-                    self.toggle_texts[entry_key][qk][attr] = ""
+            for t_edit in self.toggle_line_edits.values():
+                t_edit.clear()
+                t_edit.setEnabled(False)
+                t_edit.setStyleSheet(_QSS_LINE_EDIT_DISABLED)
 
-        # Clear mandatory text inputs and their texts
-        for m_input in self.mandatory_text_inputs.values():
-            m_input.clear()
+            # Clear mandatory text inputs
+            for m_input in self.mandatory_text_inputs.values():
+                m_input.clear()
 
-        # Clear stored mandatory text structures
-        for entry_key in self.mandatory_texts:
-            for qk in self.mandatory_texts[entry_key]:
-                for attr in list(self.mandatory_texts[entry_key][qk].keys()):
-                    self.mandatory_texts[entry_key][qk][attr] = ""
+        # Show the now empty lists of the multiple-selection widgets
+        for widget_key in self._selected_values_layouts:
+            self._update_multiple_selection_display(*widget_key)
 
-        QMessageBox.information(self, "Cleared", "All selections cleared")
+        self.statusBar().showMessage("All selections cleared", 2000)
 
 
 def main() -> None:
@@ -23,7 +23,7 @@ without extra packages.
 from __future__ import annotations
 
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional
 
 
 def _load_config(config_path: str) -> List[Dict[str, Any]]:
@@ -31,7 +31,7 @@ def _load_config(config_path: str) -> List[Dict[str, Any]]:
         with open(config_path, 'r') as f:
             data = json.load(f)
             # Accept either a dict with 'rules' key or a raw list
-            if isinstance(data, dict) and 'rules' in data:
+            if isinstance(data, dict) and isinstance(data.get('rules'), list):
                 return data['rules']
             if isinstance(data, list):
                 return data
@@ -40,6 +40,77 @@ def _load_config(config_path: str) -> List[Dict[str, Any]]:
     return []
 
 
+class CompiledRule(NamedTuple):
+    """A rule with its fields resolved and its expected values normalized up front."""
+    when_source: str
+    when_question: str
+    when_attribute: str
+    when_expected: Any
+    when_normalized: Optional[str]
+    then_source: str
+    then_question: str
+    then_attribute: str
+    then_must_equal: bool  # False for must_not_equal
+    then_expected: Any
+    then_normalized: Optional[str]
+    message: str
+
+
+def compile_rules(rules: List[Dict[str, Any]]) -> List[CompiledRule]:
+    """Resolve the rules once so validation does no parsing or normalization per paper.
+
+    Rules that can never report a violation (malformed entries, missing question/attribute
+    or no supported operator) are dropped.
+    """
+    compiled: List[CompiledRule] = []
+    for rule in rules:
+        if not isinstance(rule, dict):
+            continue
+        when = rule.get('when', {})
+        then = rule.get('then', {})
+        if not isinstance(when, dict) or not isinstance(then, dict):
+            continue
+
+        src = when.get('source', 'response')
+        q = when.get('question')
+        a = when.get('attribute')
+        if q is None or a is None or 'equals' not in when:
+            continue
+        expected = bool(when['equals']) if src == 'toggle' else when['equals']
+
+        t_src = then.get('source', 'response')
+        t_q = then.get('question')
+        t_a = then.get('attribute')
+        if t_q is None or t_a is None:
+            continue
+        if 'must_equal' in then:
+            must_equal = True
+            t_expected = then['must_equal']
+        elif 'must_not_equal' in then:
+            must_equal = False
+            t_expected = then['must_not_equal']
+        else:
+            continue
+        if t_src == 'toggle':
+            t_expected = bool(t_expected)
+
+        message = rule.get('message', None) or f"Rule '{rule.get('id', '<unknown>')}' violated"
+        compiled.append(CompiledRule(
+            src, q, a, expected, _normalize_expected(expected),
+            t_src, t_q, t_a, must_equal, t_expected, _normalize_expected(t_expected),
+            message,
+        ))
+    return compiled
+
+
+def load_rules(config_path: str = 'sanity_checks.json') -> List[CompiledRule]:
+    """Load and compile the rules from config_path once so they can be reused across validations.
+
+    Returns an empty list when the config is missing or invalid.
+    """
+    return compile_rules(_load_config(config_path))
+
+
 def _get_response_values(paper_entry: Dict[str, Any], question: str, attribute: str) -> List[str]:
     responses = paper_entry.get('responses', {})
     q = responses.get(question, {})
@@ -59,24 +130,30 @@ def _get_toggle_enabled(paper_entry: Dict[str, Any], question: str, attribute: s
     return False
 
 
+def _normalize_text(s: str) -> str:
+    # Lowercase, strip whitespace, replace common punctuation with space
+    return ''.join(ch.lower() if ch.isalnum() or ch.isspace() else ' ' for ch in s).strip()
+
+
+def _normalize_expected(expected: Any) -> Optional[str]:
+    return _normalize_text(expected) if isinstance(expected, str) else None
+
+
 def _matches_value_in_list(values: List[str], expected: Any) -> bool:
     """Return True if expected matches any entry in values.
 
     Matching allows exact string match or entries with prefixes like "Other: ..." or "Discussion needed: ...".
     For example, expected=="Other" will match "Other: foo".
     """
+    return _matches_normalized(values, expected, _normalize_expected(expected))
+
+
+def _matches_normalized(values: List[str], expected: Any, norm_expected: Optional[str]) -> bool:
+    """Like _matches_value_in_list, with expected already normalized by _normalize_expected."""
     # Booleans are not matched here
     if isinstance(expected, bool):
         return False
 
-    def _normalize_text(s: str) -> str:
-        # Lowercase, strip whitespace, replace common punctuation with space
-        return ''.join(ch.lower() if ch.isalnum() or ch.isspace() else ' ' for ch in s).strip()
-
-    norm_expected = None
-    if isinstance(expected, str):
-        norm_expected = _normalize_text(expected)
-
     for v in values:
         # Exact match for non-strings (unlikely) or string compare
         if v == expected:
@@ -96,93 +173,70 @@ def _matches_value_in_list(values: List[str], expected: Any) -> bool:
     return False
 
 
-def validate_paper(paper_entry: Dict[str, Any], config_path: str = 'sanity_checks.json') -> List[str]:
+def validate_paper(paper_entry: Dict[str, Any], config_path: str = 'sanity_checks.json',
+                   rules: Optional[List[CompiledRule]] = None) -> List[str]:
     """Validate a single paper export entry against rules in config_path.
 
+    Pass rules obtained from load_rules() to skip reading config_path on every call.
+
     Returns a list of human-readable violation messages (empty when all pass).
     """
-    rules = _load_config(config_path)
+    if rules is None:
+        rules = load_rules(config_path)
     violations: List[str] = []
 
     for rule in rules:
-        when = rule.get('when', {})
-        then = rule.get('then', {})
-        message = rule.get('message', None)
-
         # Evaluate `when` condition
-        src = when.get('source', 'response')
-        q = when.get('question')
-        a = when.get('attribute')
-
-        if src == 'toggle':
-            if q is None or a is None:
-                continue
-            actual = _get_toggle_enabled(paper_entry, q, a)
-            # 'equals' can be boolean
-            if 'equals' in when:
-                expected = bool(when['equals'])
-                condition_met = (actual == expected)
-            else:
-                # no supported operator -> skip
-                condition_met = False
+        if rule.when_source == 'toggle':
+            actual = _get_toggle_enabled(paper_entry, rule.when_question, rule.when_attribute)
+            condition_met = (actual == rule.when_expected)
         else:  # response (default)
-            if q is None or a is None:
-                continue
-            values = _get_response_values(paper_entry, q, a)
-            if 'equals' in when:
-                expected = when['equals']
-                condition_met = _matches_value_in_list(values, expected)
-            else:
-                condition_met = False
+            values = _get_response_values(paper_entry, rule.when_question, rule.when_attribute)
+            condition_met = _matches_normalized(values, rule.when_expected, rule.when_normalized)
 
         if not condition_met:
             # when not met -> rule not applicable
             continue
 
-        # Evaluate `then` assertions
-        t_src = then.get('source', 'response')
-        t_q = then.get('question')
-        t_a = then.get('attribute')
-
-        if t_src == 'toggle':
-            if t_q is None or t_a is None:
-                continue
-            actual = _get_toggle_enabled(paper_entry, t_q, t_a)
-            if 'must_equal' in then:
-                expected = bool(then['must_equal'])
-                ok = (actual == expected)
-            elif 'must_not_equal' in then:
-                expected = bool(then['must_not_equal'])
-                ok = (actual != expected)
-            else:
-                ok = True
+        # Evaluate `then` assertion
+        if rule.then_source == 'toggle':
+            actual = _get_toggle_enabled(paper_entry, rule.then_question, rule.then_attribute)
+            matches = (actual == rule.then_expected)
         else:
-            if t_q is None or t_a is None:
-                continue
-            target_values = _get_response_values(paper_entry, t_q, t_a)
-            if 'must_equal' in then:
-                expected = then['must_equal']
-                ok = _matches_value_in_list(target_values, expected)
-            elif 'must_not_equal' in then:
-                expected = then['must_not_equal']
-                ok = not _matches_value_in_list(target_values, expected)
-            else:
-                ok = True
-
-        if not ok:
-            if message:
-                violations.append(message)
-            else:
-                violations.append(f"Rule '{rule.get('id', '<unknown>')}' violated")
+            target_values = _get_response_values(paper_entry, rule.then_question, rule.then_attribute)
+            matches = _matches_normalized(target_values, rule.then_expected, rule.then_normalized)
+
+        if matches != rule.then_must_equal:
+            violations.append(rule.message)
 
     return violations
 
 
+def validate_export(export_data: Dict[str, Any], config_path: str = 'sanity_checks.json',
+                    rules: Optional[List[CompiledRule]] = None) -> Dict[str, List[str]]:
+    """Validate every paper of a full export (paper key -> paper entry) against the rules.
+
+    The rules are compiled once for the whole batch. Excluded papers are skipped.
+
+    Returns a mapping of paper key to violation messages for the papers that have any.
+    """
+    if rules is None:
+        rules = load_rules(config_path)
+    results: Dict[str, List[str]] = {}
+    for paper_key, paper_entry in export_data.items():
+        if not isinstance(paper_entry, dict) or paper_entry.get('excluded_from_full_text_review', False):
+            continue
+        violations = validate_paper(paper_entry, rules=rules)
+        if violations:
+            results[paper_key] = violations
+    return results
+
+
 if __name__ == '__main__':
     # Simple manual test helper
     import sys
     if len(sys.argv) < 2:
-        print('Usage: sanity_checks.py <exported_paper_json> [config.json]')
+        print('Usage: sanity_checks.py <exported_paper_json | export.json> [config.json]')
         sys.exit(2)
     paper_path = sys.argv[1]
     cfg = sys.argv[2] if len(sys.argv) > 2 else 'sanity_checks.json'
@@ -192,10 +246,21 @@ if __name__ == '__main__':
     except Exception as e:
         print('Error loading paper file:', e)
         sys.exit(2)
-    v = validate_paper(paper, cfg)
-    if v:
-        print('Violations:')
-        for vv in v:
-            print('-', vv)
-        sys.exit(1)
+    if 'responses' in paper:
+        v = validate_paper(paper, cfg)
+        if v:
+            print('Violations:')
+            for vv in v:
+                print('-', vv)
+            sys.exit(1)
+    else:
+        # A full export: paper key -> paper entry
+        results = validate_export(paper, cfg)
+        if results:
+            print('Violations:')
+            for paper_key, v in results.items():
+                print(f'{paper_key}:')
+                for vv in v:
+                    print('-', vv)
+            sys.exit(1)
     print('No violations')
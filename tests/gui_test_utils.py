@@ -0,0 +1,91 @@
+"""Helpers shared by the tests that drive the GUI."""
+
+import csv
+import importlib.util
+import json
+import os
+import pathlib
+import sys
+from contextlib import contextmanager
+
+
+def load_gui_module():
+    # The module is executed once per test session and shared via sys.modules
+    module = sys.modules.get("data_extraction_gui")
+    if module is not None:
+        return module
+
+    workspace_root = pathlib.Path(__file__).resolve().parents[1]
+    if str(workspace_root) not in sys.path:
+        sys.path.insert(0, str(workspace_root))
+
+    module_path = workspace_root / "data-extraction-gui.py"
+    spec = importlib.util.spec_from_file_location("data_extraction_gui", module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Could not load data-extraction-gui.py")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    return module
+
+
+@contextmanager
+def working_directory(path: pathlib.Path):
+    previous = pathlib.Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def write_test_files(root: pathlib.Path, data_items: dict):
+    """Write data-items.json and an assignment CSV with papers P1 and P2 for Moritz."""
+    data_items_path = root / "data-items.json"
+    csv_path = root / "assignments.csv"
+
+    with data_items_path.open("w", encoding="utf-8") as f:
+        json.dump(data_items, f)
+
+    with csv_path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=["itemkey", "title", "author", "year", "assignee"],
+            delimiter=";",
+        )
+        writer.writeheader()
+        writer.writerow(
+            {
+                "itemkey": "P1",
+                "title": "Paper 1",
+                "author": "Author A",
+                "year": "2024",
+                "assignee": "Moritz",
+            }
+        )
+        writer.writerow(
+            {
+                "itemkey": "P2",
+                "title": "Paper 2",
+                "author": "Author B",
+                "year": "2025",
+                "assignee": "Moritz",
+            }
+        )
+
+    return data_items_path, csv_path
+
+
+def create_window(gui_module, root: pathlib.Path, data_items: dict):
+    """Write the test files to root and open a window on them."""
+    data_items_path, csv_path = write_test_files(root, data_items)
+    return gui_module.DataExtractionGUI(
+        user="Moritz",
+        json_file=str(data_items_path),
+        csv_file=str(csv_path),
+    )
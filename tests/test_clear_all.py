@@ -0,0 +1,61 @@
+import os
+import pathlib
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QLabel
+
+from gui_test_utils import create_window, load_gui_module, working_directory
+
+DATA_ITEMS = {
+    "RQ1": {
+        "Choice": ["yes", "no", "single-choice"],
+        "Techniques": ["Alpha", "Beta", "Multiple"],
+    }
+}
+
+
+class TestClearAll(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+        cls.gui_module = load_gui_module()
+
+    def setUp(self):
+        root = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(working_directory(root))
+        self.window = create_window(self.gui_module, root, DATA_ITEMS)
+        self.addCleanup(self.window.close)
+
+    def test_clear_all_unchecks_radios_and_empties_multiple_selection(self):
+        window = self.window
+        window.radio_buttons["P1_RQ1_Choice_yes"].setChecked(True)
+        window.comboboxes["P1_RQ1_Techniques_multiple"].setCurrentText("Alpha")
+        window.on_multiple_add_value("P1", "RQ1", "Techniques")
+        self.assertEqual(window.selected_values["P1"]["RQ1"]["Choice"], ["yes"])
+        self.assertEqual(window.selected_values["P1"]["RQ1"]["Techniques"], ["Alpha"])
+
+        window.clear_all()
+
+        # The radios are in an exclusive group, which must stay exclusive
+        radio_group = window.radio_button_groups["P1_RQ1_Choice"]
+        self.assertTrue(radio_group.exclusive())
+        self.assertFalse(any(radio.isChecked() for radio in radio_group.buttons()))
+        self.assertEqual(window.selected_values["P1"]["RQ1"]["Choice"], [])
+
+        selected_layout = window._selected_values_layouts[("P1", "RQ1", "Techniques")]
+        labels = [
+            item.widget().text()
+            for item in (
+                selected_layout.itemAt(i) for i in range(selected_layout.count())
+            )
+            if isinstance(item.widget(), QLabel)
+        ]
+        self.assertEqual(labels, ["No values selected yet"])
+        self.assertEqual(window.selected_values["P1"]["RQ1"]["Techniques"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from gui_test_utils import create_window, load_gui_module, working_directory
+
+DATA_ITEMS = {
+    "RQ1": {
+        "Category": ["Option A", "Option B"],
+        "Scope": ["Local", "Global"],
+    },
+    "RQ2": {"Setting": ["Lab", "Field"]},
+}
+OPTION_A_KEY = "P1_RQ1_Category_Option A"
+
+
+class TestExportPersistence(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+        cls.gui_module = load_gui_module()
+
+    def setUp(self):
+        # Every test starts without an export.json of a previous test
+        self.root = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(working_directory(self.root))
+        self.window = create_window(self.gui_module, self.root, DATA_ITEMS)
+        self.addCleanup(self.window.close)
+
+    def _read_export(self) -> dict:
+        with (self.root / "export.json").open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _category(self, export: dict, entry_key: str) -> list:
+        return export[entry_key]["responses"].get("RQ1", {}).get("Category", [])
+
+    def test_edit_followed_by_paper_switch_is_persisted(self):
+        window = self.window
+        window.export_data(show_box=False)
+
+        window.checkboxes[OPTION_A_KEY].setChecked(True)
+        window.load_paper(1)
+        window.export_data(show_box=False)
+
+        self.assertEqual(self._category(self._read_export(), "P1"), ["Option A"])
+
+    def test_missing_export_file_rewrites_every_paper_in_memory(self):
+        window = self.window
+        window.checkboxes[OPTION_A_KEY].setChecked(True)
+        window.load_paper(1)
+        window.export_data(show_box=False)
+
+        # P1 is no longer marked as edited, but the file it was saved in is gone
+        (self.root / "export.json").unlink()
+        window.export_data(show_box=False)
+
+        export = self._read_export()
+        self.assertEqual(set(export), {"P1", "P2"})
+        self.assertEqual(self._category(export, "P1"), ["Option A"])
+
+    def test_unreadable_export_file_rewrites_every_paper_in_memory(self):
+        window = self.window
+        window.checkboxes[OPTION_A_KEY].setChecked(True)
+        window.load_paper(1)
+        window.export_data(show_box=False)
+
+        (self.root / "export.json").write_text("{not json", encoding="utf-8")
+        window.export_data(show_box=False)
+
+        export = self._read_export()
+        self.assertEqual(set(export), {"P1", "P2"})
+        self.assertEqual(self._category(export, "P1"), ["Option A"])
+
+    def test_unchanged_state_does_not_rewrite_export_file(self):
+        window = self.window
+        window.checkboxes[OPTION_A_KEY].setChecked(True)
+        window.load_paper(1)
+        window.export_data(show_box=False)
+
+        # Any write would move the modification time away from this marker
+        export_path = self.root / "export.json"
+        marker_ns = 1_000_000_000
+        os.utime(export_path, ns=(marker_ns, marker_ns))
+        window.export_data(show_box=False)
+        window.load_paper(0)
+        window.export_data(show_box=False)
+
+        self.assertEqual(export_path.stat().st_mtime_ns, marker_ns)
+        self.assertEqual(self._category(self._read_export(), "P1"), ["Option A"])
+
+    def test_clear_all_writes_cleared_state_of_every_paper(self):
+        window = self.window
+        window.checkboxes[OPTION_A_KEY].setChecked(True)
+        window.load_paper(1)
+        window.export_data(show_box=False)
+
+        # P1 is not the open paper, but clear_all resets it as well
+        window.clear_all()
+        window.export_data(show_box=False)
+
+        self.assertEqual(self._category(self._read_export(), "P1"), [])
+
+    def test_export_cache_is_reused_until_file_changes_on_disk(self):
+        window = self.window
+        window.checkboxes[OPTION_A_KEY].setChecked(True)
+        window.export_data(show_box=False)
+        self.assertIs(window._get_exported_data(), window._get_exported_data())
+
+        # Another process adds a paper; the new modification time invalidates the cache
+        export_path = self.root / "export.json"
+        export = self._read_export()
+        export["P9"] = {"responses": {"RQ1": {"Category": ["Option B"]}}}
+        export_path.write_text(json.dumps(export), encoding="utf-8")
+        os.utime(export_path, ns=(1_000_000_000, 1_000_000_000))
+
+        window.checkboxes["P1_RQ1_Category_Option B"].setChecked(True)
+        window.export_data(show_box=False)
+
+        export = self._read_export()
+        self.assertEqual(self._category(export, "P9"), ["Option B"])
+        self.assertEqual(self._category(export, "P1"), ["Option A", "Option B"])
+
+    def test_export_without_empty_attributes_round_trips(self):
+        window = self.window
+        window.checkboxes[OPTION_A_KEY].setChecked(True)
+        window.load_paper(1)
+        window.close()
+
+        # Attributes and questions without a selection are not written
+        export = self._read_export()
+        self.assertEqual(export["P1"]["responses"], {"RQ1": {"Category": ["Option A"]}})
+        self.assertEqual(export["P2"]["responses"], {})
+
+        # A new window must not resume from the session, only from the export
+        (self.root / ".session.json").unlink(missing_ok=True)
+        reopened = create_window(self.gui_module, self.root, DATA_ITEMS)
+        self.addCleanup(reopened.close)
+
+        self.assertEqual(reopened.find_first_unprocessed_paper(), 1)
+        self.assertEqual(reopened.current_paper_index, 1)
+        self.assertEqual([paper[0] for paper in reopened.get_finished_papers()], ["P1"])
+
+        reopened.load_paper(0)
+        self.assertTrue(reopened.checkboxes[OPTION_A_KEY].isChecked())
+        self.assertFalse(reopened.checkboxes["P1_RQ1_Scope_Local"].isChecked())
+        self.assertEqual(
+            reopened.selected_values["P1"]["RQ1"],
+            {"Category": ["Option A"], "Scope": []},
+        )
+        self.assertEqual(reopened.selected_values["P1"]["RQ2"], {"Setting": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Pytest tests for the sanity check rules."""
+
+import json
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import sanity_checks  # noqa: E402
+
+RULES = [
+    {
+        "id": "code_available_requires_not_pseudocode",
+        "when": {
+            "source": "response",
+            "question": "General information",
+            "attribute": "Code available?",
+            "equals": "yes",
+        },
+        "then": {
+            "source": "response",
+            "question": "Evaluation (RQ5)",
+            "attribute": "State of explainability",
+            "must_not_equal": "Pseudo-code",
+        },
+        "message": "Code available but pseudo-code only.",
+    },
+    {
+        "id": "toggle_requires_other",
+        "when": {
+            "source": "toggle",
+            "question": "Stakeholder (RQ4)",
+            "attribute": "Stakeholder type",
+            "equals": True,
+        },
+        "then": {
+            "source": "response",
+            "question": "Stakeholder (RQ4)",
+            "attribute": "Stakeholder type",
+            "must_equal": "Other",
+        },
+    },
+]
+
+
+def _paper(code_available: str, state: str, toggle: bool = False) -> dict:
+    return {
+        "responses": {
+            "General information": {"Code available?": [code_available]},
+            "Evaluation (RQ5)": {"State of explainability": [state]},
+            "Stakeholder (RQ4)": {"Stakeholder type": ["Other: Operators"]},
+        },
+        "toggle_states": {
+            "Stakeholder (RQ4)": {"Stakeholder type": {"enabled": toggle, "text": ""}}
+        },
+    }
+
+
+def test_validate_paper_with_compiled_rules_matches_config_path(tmp_path) -> None:
+    config_path = tmp_path / "sanity_checks.json"
+    config_path.write_text(json.dumps(RULES), encoding="utf-8")
+    rules = sanity_checks.load_rules(str(config_path))
+    paper = _paper("yes", "Pseudo-code")
+
+    assert sanity_checks.validate_paper(paper, rules=rules) == [
+        "Code available but pseudo-code only."
+    ]
+    assert sanity_checks.validate_paper(
+        paper, config_path=str(config_path)
+    ) == sanity_checks.validate_paper(paper, rules=rules)
+
+
+def test_compile_rules_drops_rules_that_cannot_fire() -> None:
+    incomplete = {
+        "when": {"question": "Q"},
+        "then": {"question": "Q", "attribute": "A"},
+    }
+    no_assertion = {
+        "when": {"question": "Q", "attribute": "A", "equals": "x"},
+        "then": {"question": "Q", "attribute": "B"},
+    }
+
+    rules = sanity_checks.compile_rules(RULES + [incomplete, no_assertion])
+
+    assert len(rules) == len(RULES)
+    assert rules[1].message == "Rule 'toggle_requires_other' violated"
+
+
+def test_load_rules_skips_malformed_entries(tmp_path) -> None:
+    config_path = tmp_path / "sanity_checks.json"
+    malformed = ["not a rule", 42, None, {"when": [], "then": "x"}]
+    config_path.write_text(json.dumps(malformed + RULES), encoding="utf-8")
+
+    rules = sanity_checks.load_rules(str(config_path))
+
+    assert len(rules) == len(RULES)
+    assert sanity_checks.validate_paper(_paper("yes", "Pseudo-code"), rules=rules) == [
+        "Code available but pseudo-code only."
+    ]
+
+    config_path.write_text(json.dumps({"rules": 42}), encoding="utf-8")
+    assert sanity_checks.load_rules(str(config_path)) == []
+
+
+def test_validate_export_reports_only_papers_with_violations() -> None:
+    rules = sanity_checks.compile_rules(RULES)
+    excluded = _paper("yes", "Pseudo-code")
+    excluded["excluded_from_full_text_review"] = True
+    export_data = {
+        "P1": _paper("yes", "Pseudo-code"),
+        "P2": _paper("no", "Pseudo-code", toggle=True),
+        "P3": excluded,
+    }
+
+    assert sanity_checks.validate_export(export_data, rules=rules) == {
+        "P1": ["Code available but pseudo-code only."]
+    }